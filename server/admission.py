@@ -0,0 +1,261 @@
+"""
+Admission Control
+
+Limits how many CPU-heavy jobs (Whisper transcriptions) run at once. Jobs
+beyond the available slots wait in a small bounded queue where shorter
+videos go first, with aging so long ones are not starved. When the queue
+is full or the estimated wait is too long, requests are rejected straight
+away with a Retry-After hint instead of piling up and all timing out.
+"""
+
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+
+class Overloaded(Exception):
+    """
+    Raised when a job cannot be admitted.
+
+    Attributes:
+        retry_after (int): Suggested number of seconds before retrying
+        status_code (int): HTTP status to respond with
+    """
+
+    def __init__(self, message, retry_after, status_code=503):
+        super().__init__(message)
+        self.retry_after = max(1, int(math.ceil(retry_after)))
+        self.status_code = status_code
+
+
+def total_memory_mb():
+    """Physical memory in MB, or None if it can't be determined."""
+    try:
+        return os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES') // (1024 * 1024)
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def default_slots(threads_per_job=2, memory_per_job_mb=1000, reserved_memory_mb=1024):
+    """
+    Number of jobs the machine can run concurrently without thrashing.
+
+    Args:
+        threads_per_job (int): CPU cores a single job should get
+        memory_per_job_mb (int): Peak memory of a single job
+        reserved_memory_mb (int): Memory kept free for the rest of the app
+
+    Returns:
+        int: Concurrent job slots (at least 1)
+    """
+    slots = max(1, (os.cpu_count() or 1) // threads_per_job)
+    memory = total_memory_mb()
+    if memory is not None:
+        slots = min(slots, (memory - reserved_memory_mb) // memory_per_job_mb)
+    return max(1, slots)
+
+
+class _Ticket:
+    """A job waiting for a slot."""
+
+    def __init__(self, duration, estimate):
+        self.duration = duration
+        self.estimate = estimate
+        self.enqueued_at = time.monotonic()
+        self.started_at = None
+
+
+class Reservation:
+    """
+    A place held for a job while it is being prepared.
+
+    Attributes:
+        claimed (bool): Whether the job has moved on to its slot
+    """
+
+    def __init__(self, controller):
+        self.controller = controller
+        self.claimed = False
+
+    def slot(self, duration=None):
+        """Run the reserved job in a slot (see AdmissionController.slot)."""
+        return self.controller.slot(duration, reservation=self)
+
+
+class AdmissionController:
+    """
+    Slot limiter with a bounded, shortest-job-first wait queue.
+
+    Processing time is estimated from audio duration with a
+    seconds-of-processing-per-second-of-audio rate that is updated as jobs
+    finish.
+    """
+
+    def __init__(self, slots=None, max_queue=8, max_wait=600, seconds_per_audio_second=0.3,
+                 default_duration=600, aging=0.5):
+        """
+        Initialize the controller.
+
+        Args:
+            slots (int): Concurrent jobs (default: sized to cores and memory)
+            max_queue (int): Maximum number of waiting jobs
+            max_wait (float): Longest estimated wait (seconds) a job is queued for
+            seconds_per_audio_second (float): Initial processing speed estimate
+            default_duration (float): Audio duration assumed when it is unknown
+            aging (float): Seconds of priority a waiting job gains per second waited
+        """
+        self.slots = slots or default_slots()
+        self.max_queue = max_queue
+        self.max_wait = max_wait
+        self.rate = seconds_per_audio_second
+        self.default_duration = default_duration
+        self.aging = aging
+
+        self._condition = threading.Condition()
+        self._running = {}
+        self._queue = []
+        self._pending = 0
+        self._completed = 0
+        self._rejected = 0
+
+    def estimate(self, duration):
+        """Estimated processing time (seconds) of audio of the given duration."""
+        return (duration or self.default_duration) * self.rate
+
+    def _priority(self, ticket, now):
+        # Shortest job first; waiting time counts against the estimate so long jobs still get a turn
+        return ticket.estimate - self.aging * (now - ticket.enqueued_at)
+
+    def _estimated_wait(self, estimate, now):
+        # Work that has to finish before a job with this estimate starts, spread over the
+        # slots; reserved jobs still being prepared are assumed to go first
+        remaining = sorted(max(0.0, end - now) for end in self._running.values())
+        ahead = sum(ticket.estimate for ticket in self._queue
+                    if self._priority(ticket, now) <= estimate)
+        ahead += self._pending * self.estimate(None)
+        if len(remaining) < self.slots:
+            return ahead / self.slots
+        return remaining[0] + (sum(remaining[1:]) + ahead) / self.slots
+
+    def _reject(self, message, retry_after):
+        self._rejected += 1
+        raise Overloaded(message, retry_after)
+
+    def _occupied(self):
+        # Places taken by running, queued and reserved jobs (caller holds the lock)
+        return len(self._running) + len(self._queue) + self._pending
+
+    def _admit_or_reject(self, estimate, now):
+        # Raise Overloaded if a new job can't be taken on (caller holds the lock)
+        if self._occupied() >= self.slots + self.max_queue:
+            self._reject("Transcription queue is full", self._estimated_wait(0, now))
+        wait = self._estimated_wait(estimate, now)
+        if wait > self.max_wait:
+            self._reject("Transcription queue is too long", wait)
+
+    @contextmanager
+    def reserve(self, duration=None):
+        """
+        Hold a place for a job while it is prepared (e.g. its audio downloaded).
+
+        Admission is decided here, before any preparatory work, so a burst is
+        turned away before it does expensive work. The place counts against
+        the slots and queue until the job claims its slot with
+        Reservation.slot() or the block exits.
+
+        Args:
+            duration (float): Expected audio duration in seconds (None if unknown)
+
+        Raises:
+            Overloaded: The slots and queue are taken or the estimated wait exceeds max_wait
+        """
+        with self._condition:
+            self._admit_or_reject(self.estimate(duration), time.monotonic())
+            self._pending += 1
+        reservation = Reservation(self)
+        try:
+            yield reservation
+        finally:
+            if not reservation.claimed:
+                with self._condition:
+                    self._pending -= 1
+
+    @contextmanager
+    def slot(self, duration=None, reservation=None):
+        """
+        Run a job in a slot, waiting in the queue for one if needed.
+
+        Args:
+            duration (float): Audio duration in seconds (None if unknown)
+            reservation (Reservation): Place held for the job by reserve(); the job
+                was already admitted and takes over the reserved place
+
+        Raises:
+            Overloaded: The queue is full, the estimated wait exceeds max_wait,
+                or no slot freed up within max_wait
+        """
+        ticket = _Ticket(duration, self.estimate(duration))
+        with self._condition:
+            now = time.monotonic()
+            if reservation is None:
+                self._admit_or_reject(ticket.estimate, now)
+            elif not reservation.claimed:
+                reservation.claimed = True
+                self._pending -= 1
+
+            if len(self._running) >= self.slots or self._queue:
+                self._queue.append(ticket)
+                deadline = now + self.max_wait
+                while ticket.started_at is None:
+                    timeout = deadline - time.monotonic()
+                    if timeout <= 0:
+                        self._queue.remove(ticket)
+                        self._reject("Timed out waiting for a transcription slot",
+                                     self._estimated_wait(ticket.estimate, time.monotonic()))
+                    self._condition.wait(timeout)
+            else:
+                self._start(ticket, now)
+
+        try:
+            yield
+        finally:
+            with self._condition:
+                elapsed = time.monotonic() - ticket.started_at
+                del self._running[ticket]
+                self._completed += 1
+                if duration:
+                    # Exponential moving average of the observed processing speed
+                    self.rate = 0.8 * self.rate + 0.2 * (elapsed / duration)
+                self._admit_waiting()
+
+    def _start(self, ticket, now):
+        # Give a job a slot (caller holds the lock)
+        ticket.started_at = now
+        self._running[ticket] = now + ticket.estimate
+
+    def _admit_waiting(self):
+        # Hand free slots to the best-priority waiting jobs (caller holds the lock)
+        now = time.monotonic()
+        admitted = False
+        while self._queue and len(self._running) < self.slots:
+            best = min(self._queue, key=lambda ticket: self._priority(ticket, now))
+            self._queue.remove(best)
+            self._start(best, now)
+            admitted = True
+        if admitted:
+            self._condition.notify_all()
+
+    def stats(self):
+        """Current load: slots, running, queued and reserved jobs, completions, rejections and speed estimate."""
+        with self._condition:
+            return {
+                'slots': self.slots,
+                'running': len(self._running),
+                'queued': len(self._queue),
+                'reserved': self._pending,
+                'completed': self._completed,
+                'rejected': self._rejected,
+                'seconds_per_audio_second': round(self.rate, 3),
+            }
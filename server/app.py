@@ -1,12 +1,24 @@
 import os
 import yt_dlp
 import whisper
+import torch
 import requests
 import warnings
 import json
-from flask import Flask, render_template, request, jsonify
+import difflib
+import queue
+from flask import Flask, Response, render_template, request, jsonify
 from flask_cors import CORS
 from dotenv import load_dotenv
+from transcript_analysis_utils import TranscriptAnalyzer
+from local_summary import summarize_locally
+from prompt_budget import compress_transcript
+from category_classifier import load_classifier
+from transcript_index import TranscriptIndex, extract_video_id
+from models import db, pipeline_key, find_result, find_transcript, save_result
+from response_compression import init_compression
+from admission import AdmissionController, Overloaded
+from profiling import RequestProfiler
 
 # Load environment 
 load_dotenv()
@@ -15,6 +27,39 @@ load_dotenv()
 app = Flask(__name__)
 CORS(app)  # Enable CROS
 
+# Persistent result store (SQLite by default)
+app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv("DATABASE_URL", "sqlite:///vidsummarizer.db")
+db.init_app(app)
+with app.app_context():
+    db.create_all()
+
+# gzip/brotli compression of responses above COMPRESSION_MIN_SIZE bytes
+init_compression(app, min_size=int(os.getenv("COMPRESSION_MIN_SIZE", "1024")))
+
+# On-demand profiling of single requests for callers holding PROFILE_TOKEN (off when unset)
+profiler = RequestProfiler(
+    token=os.getenv("PROFILE_TOKEN"),
+    max_profiles=int(os.getenv("PROFILE_KEEP", "20"))
+)
+profiler.init_app(app)
+
+# Categories a video can be classified into
+CATEGORY_LABELS = [
+    'Technology', 'Education', 'Health', 'Finance', 'Entertainment',
+    'Science', 'Business', 'Politics', 'Sports', 'Lifestyle',
+    'News', 'Gaming', 'Music', 'Art', 'Travel',
+    'Food', 'Fashion', 'Automotive', 'Environment', 'History'
+]
+
+# Initialize local category classifier (Gemini is only asked when it is unsure)
+CATEGORY_CONFIDENCE_THRESHOLD = float(os.getenv("CATEGORY_CONFIDENCE_THRESHOLD", "0.5"))
+local_classifier = None
+try:
+    local_classifier = load_classifier(os.getenv("CATEGORY_MODEL_PATH"))
+    print("Successfully initialized local category classifier")
+except Exception as e:
+    print(f"Error initializing local category classifier: {e}")
+
 # Initialize zero-shot classifier 
 classifier = None
 try:
@@ -32,6 +77,9 @@ try:
         {text[:2000]}  # Using first 2000 chars for brevity
         """
         result = query_gemini(prompt).strip()
+        if is_gemini_error(result):
+            # Let detect_category fall back instead of guessing a label from an error
+            raise RuntimeError(f"Gemini classification failed: {result[:200]}")
         
         # If result is not in candidate_labels, use the most similar one
         if result not in candidate_labels:
@@ -62,11 +110,43 @@ except Exception as e:
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
 GEMINI_API_URL = f"https://generativelanguage.googleapis.com/v1beta/models/gemini-2.0-flash:generateContent?key={GEMINI_API_KEY}"
 
+GEMINI_TIMEOUT = float(os.getenv("GEMINI_TIMEOUT", "60"))  # Seconds per Gemini call
+
+# Summary mode: 'gemini', 'local' (extractive, no LLM) or 'auto' (Gemini with local fallback)
+SUMMARY_MODE = os.getenv("SUMMARY_MODE", "auto")
+SUMMARY_MODES = ('gemini', 'local', 'auto')
+# Local summaries are extracted from the transcript by the English TranscriptAnalyzer
+LOCAL_SUMMARY_LANGUAGE = "en"
+
+# Transcript compression before prompting Gemini
+PROMPT_COMPRESSION = os.getenv("PROMPT_COMPRESSION", "true").lower() == "true"
+PROMPT_TOKEN_BUDGET = int(os.getenv("PROMPT_TOKEN_BUDGET", "4000"))
+
+# Local transcript analyzer used by the local summary mode and prompt compression
+analyzer = TranscriptAnalyzer()
+
+# Persistent, searchable index of timestamped transcript segments
+transcript_index = TranscriptIndex(os.getenv("TRANSCRIPT_DB_PATH", "transcripts.db"))
+
+# Admission control for Whisper: a few concurrent transcriptions (sized to cores and memory
+# unless TRANSCRIPTION_SLOTS is set) and a short queue where shorter videos go first
+transcription_admission = AdmissionController(
+    slots=int(os.getenv("TRANSCRIPTION_SLOTS", "0")) or None,
+    max_queue=int(os.getenv("TRANSCRIPTION_QUEUE_SIZE", "8")),
+    max_wait=float(os.getenv("TRANSCRIPTION_MAX_WAIT", "600"))
+)
+# Split the cores between the slots so concurrent transcriptions don't oversubscribe the CPU
+torch.set_num_threads(max(1, (os.cpu_count() or 1) // transcription_admission.slots))
+
 # Add a global dictionary to store transcripts and summaries by session
 video_sessions = {}
 
 # Download audio from YouTube
 def download_audio(youtube_url):
+    return download_audio_with_duration(youtube_url)[0]
+
+# Download audio and report its duration in seconds (None if unknown)
+def download_audio_with_duration(youtube_url):
     # Ensure downloads directory exists
     os.makedirs('downloads', exist_ok=True)
     
@@ -84,27 +164,46 @@ def download_audio(youtube_url):
     with yt_dlp.YoutubeDL(options) as ydl:
         info = ydl.extract_info(youtube_url, download=True)
         audio_file = ydl.prepare_filename(info).replace(".webm", ".mp3").replace(".m4a", ".mp3")
-        return audio_file
+        return audio_file, info.get('duration')
 
 # Transcribe audio using Whisper
 # Configure warnings to suppress FP16 warning
 warnings.filterwarnings("ignore", message="FP16 is not supported on CPU; using FP32 instead")
 
-# Load the model normally without fp16 parameter
-transcriber = whisper.load_model("base")
+# Load the model normally without fp16 parameter. Whisper's decoder installs kv-cache
+# hooks on the model it runs, so concurrent transcriptions must not share a model:
+# load one per transcription slot and hand them out from a pool
+transcribers = queue.Queue()
+for _ in range(transcription_admission.slots):
+    transcribers.put(whisper.load_model("base"))
+TRANSCRIPTION_ERROR = "Error in transcription. Please try again with a different video."
 def transcribe_audio(audio_file):
+    return transcribe_audio_segments(audio_file)[0]
+
+# Transcribe audio and keep Whisper's timestamped segments
+def transcribe_audio_segments(audio_file):
+    transcriber = transcribers.get()
     try:
         result = transcriber.transcribe(audio_file)
-        return result["text"]
+        segments = [
+            {'start': segment['start'], 'end': segment['end'], 'text': segment['text'].strip()}
+            for segment in result.get("segments", [])
+        ]
+        return result["text"], segments
     except Exception as e:
         print(f"Error transcribing audio: {e}")
-        return "Error in transcription. Please try again with a different video."
+        return TRANSCRIPTION_ERROR, []
+    finally:
+        transcribers.put(transcriber)
 
 # Send prompt to Gemini API
 def query_gemini(prompt):
     payload = {"contents": [{"parts": [{"text": prompt}]}]}
     headers = {'Content-Type': 'application/json'}
-    response = requests.post(GEMINI_API_URL, headers=headers, json=payload)
+    try:
+        response = requests.post(GEMINI_API_URL, headers=headers, json=payload, timeout=GEMINI_TIMEOUT)
+    except requests.RequestException as e:
+        return f"Error: {e}"
     if response.status_code == 200:
         return response.json()['candidates'][0]['content']['parts'][0]['text']
     else:
@@ -112,12 +211,18 @@ def query_gemini(prompt):
 
 # Detect category with language support
 def detect_category(text):
-    candidate_labels = [
-        'Technology', 'Education', 'Health', 'Finance', 'Entertainment',
-        'Science', 'Business', 'Politics', 'Sports', 'Lifestyle',
-        'News', 'Gaming', 'Music', 'Art', 'Travel',
-        'Food', 'Fashion', 'Automotive', 'Environment', 'History'
-    ]
+    candidate_labels = CATEGORY_LABELS
+    
+    # Try the local classifier first and only go to Gemini when it is unsure
+    if local_classifier:
+        try:
+            result = local_classifier.classify(text, candidate_labels)
+            label, confidence = result['labels'][0], result['scores'][0]
+            if confidence >= CATEGORY_CONFIDENCE_THRESHOLD:
+                return label
+            print(f"Local classifier unsure ({label}: {confidence:.2f}), asking Gemini")
+        except Exception as e:
+            print(f"Error using local classifier: {e}")
     
     # Try using transformers pipeline if available
     if classifier:
@@ -203,6 +308,22 @@ def summarize_transcript(text, language="en"):
     
     return query_gemini(prompt)
 
+# Placeholder structured info used when Gemini's answer is empty or can't be parsed
+STRUCTURED_INFO_DEFAULTS = {
+    "key_topics": ["AI-generated main topic from the video"],
+    "key_notes": ["Important fact from the video content"],
+    "key_insights": ["Key takeaway from the content", "Significant conclusion"]
+}
+STRUCTURED_INFO_FALLBACK = {
+    "key_topics": ["Video main topic", "Secondary topic"],
+    "key_notes": ["Important fact from the video", "Notable information mentioned"],
+    "key_insights": ["Key takeaway from the content", "Significant conclusion"]
+}
+STRUCTURED_INFO_PLACEHOLDERS = {
+    item for placeholders in (STRUCTURED_INFO_DEFAULTS, STRUCTURED_INFO_FALLBACK)
+    for items in placeholders.values() for item in items
+}
+
 # Extract structured information from summary
 def extract_structured_info(summary, language="en"):
     language_names = {
@@ -264,14 +385,9 @@ def extract_structured_info(summary, language="en"):
             raise ValueError("Missing required keys in the response")
             
         # Ensure we have at least some content
-        if not structured_data['key_topics'] or len(structured_data['key_topics']) == 0:
-            structured_data['key_topics'] = ["AI-generated main topic from the video"]
-            
-        if not structured_data['key_notes'] or len(structured_data['key_notes']) == 0:
-            structured_data['key_notes'] = ["Important fact from the video content"]
-            
-        if not structured_data['key_insights'] or len(structured_data['key_insights']) == 0:
-            structured_data['key_insights'] = ["Key takeaway from the content", "Significant conclusion"]
+        for key, placeholder in STRUCTURED_INFO_DEFAULTS.items():
+            if not structured_data[key]:
+                structured_data[key] = list(placeholder)
         
         return structured_data
     except Exception as e:
@@ -279,11 +395,189 @@ def extract_structured_info(summary, language="en"):
         print(f"Response that failed parsing: {response}")
         
         # Fallback with minimal structured data
-        return {
-            "key_topics": ["Video main topic", "Secondary topic"],
-            "key_notes": ["Important fact from the video", "Notable information mentioned"],
-            "key_insights": ["Key takeaway from the content", "Significant conclusion"]
-        }
+        return {key: list(items) for key, items in STRUCTURED_INFO_FALLBACK.items()}
+
+# Check whether a Gemini call returned an error instead of content
+def is_gemini_error(text):
+    return not text or text.startswith("Error:")
+
+# Shrink the transcript to the prompt token budget before sending it to Gemini
+def prepare_prompt_transcript(transcription):
+    if not PROMPT_COMPRESSION:
+        return transcription
+    try:
+        compressed, stats = compress_transcript(analyzer, transcription, PROMPT_TOKEN_BUDGET)
+        if transcription.strip() and not compressed.strip():
+            raise ValueError("compression left no transcript text")
+        print(f"Compressed transcript for prompting: {stats['original_tokens']} -> "
+              f"{stats['compressed_tokens']} tokens ({stats['ratio']:.0%} of original, "
+              f"{stats['kept_sentences']}/{stats['sentences']} sentences kept)")
+        return compressed
+    except Exception as e:
+        print(f"Error compressing transcript, using it verbatim: {e}")
+        return transcription
+
+# Raise on a failed Gemini call when the pipeline should stop at the first error
+def check_gemini_response(text, stop_on_error):
+    if stop_on_error and is_gemini_error(text):
+        raise RuntimeError(f"Gemini call failed: {(text or 'empty response')[:200]}")
+    return text
+
+# Run the Gemini pipeline for a transcript
+def summarize_with_gemini(transcription, language="en", category=None, stop_on_error=False):
+    prompt_text = prepare_prompt_transcript(transcription)
+    if category is None:
+        category = check_gemini_response(detect_category(prompt_text), stop_on_error)  # Always get category in English
+    context = check_gemini_response(understand_context(prompt_text, language), stop_on_error)
+    summary = check_gemini_response(summarize_transcript(prompt_text, language), stop_on_error)
+    
+    # Extract structured information from summary
+    structured_info = extract_structured_info(summary, language)
+    
+    return {
+        'category': category,
+        'context': context,
+        'summary': summary,
+        'key_topics': structured_info['key_topics'],
+        'key_notes': structured_info['key_notes'],
+        'key_insights': structured_info['key_insights'],
+        'summary_mode': 'gemini',
+        'language': language,
+    }
+
+# Pick the most likely category locally, however confident the classifier is
+def local_category(text):
+    if not local_classifier:
+        return ''
+    return local_classifier.classify(text, CATEGORY_LABELS)['labels'][0]
+
+# Build the summary result locally from the transcript (no LLM calls)
+def summarize_with_analyzer(transcription, category=None):
+    if not category:
+        category = local_category(transcription)
+    result = summarize_locally(analyzer, transcription, category=category)
+    result['summary_mode'] = 'local'
+    result['language'] = LOCAL_SUMMARY_LANGUAGE
+    return result
+
+# Build the summary result using the requested mode
+def generate_summary_result(transcription, language="en", mode=SUMMARY_MODE, category=None):
+    if mode == 'local' or (mode == 'auto' and not GEMINI_API_KEY):
+        return summarize_with_analyzer(transcription, category)
+    if mode == 'gemini':
+        return summarize_with_gemini(transcription, language, category)
+    
+    # Auto mode: use Gemini, but fall back to the local summary as soon as a call fails
+    try:
+        return summarize_with_gemini(transcription, language, category, stop_on_error=True)
+    except Exception as e:
+        print(f"Gemini summarization failed, using local summary: {e}")
+        result = summarize_with_analyzer(transcription, category)
+        result['fallback'] = True  # Stand-in for a transient failure, not worth storing
+        return result
+
+# Stored pipelines that can answer a request in the given mode, most preferred first.
+# Auto mode only settles for a stored local summary when Gemini isn't configured.
+def stored_pipelines(mode):
+    if mode == 'auto':
+        if GEMINI_API_KEY:
+            return [pipeline_key('gemini')]
+        return [pipeline_key('gemini'), pipeline_key('local')]
+    return [pipeline_key(mode)]
+
+# Save a finished result (under the language it is actually in) unless it contains
+# transcription or Gemini errors, placeholder structured info or is an auto-mode fallback
+def store_result(video_id, result, transcription):
+    if transcription == TRANSCRIPTION_ERROR or result.get('fallback'):
+        return
+    if result['summary_mode'] == 'gemini' and any(
+            is_gemini_error(result[key]) for key in ('category', 'context', 'summary')):
+        return
+    if any(item in STRUCTURED_INFO_PLACEHOLDERS
+           for key in ('key_topics', 'key_notes', 'key_insights') for item in result[key]):
+        return
+    try:
+        save_result(video_id, result['language'], result, transcription)
+    except Exception as e:
+        db.session.rollback()
+        print(f"Error storing result for {video_id}: {e}")
+
+# Read how much of the transcript a response should include
+def transcript_options(values):
+    limit = values.get('transcript_limit', type=int)
+    return {
+        'include_transcript': values.get('include_transcript', 'true').lower() != 'false',
+        'transcript_offset': max(values.get('transcript_offset', 0, type=int), 0),
+        'transcript_limit': max(limit, 1) if limit is not None else None,
+    }
+
+# Cut one page out of a transcript, ending on a word boundary where possible
+def transcript_page(transcription, offset, limit):
+    total = len(transcription)
+    offset = min(offset, total)
+    end = total if limit is None else min(offset + limit, total)
+    if end < total:
+        boundary = transcription.rfind(' ', offset, end)
+        if boundary > offset:
+            end = boundary + 1
+    return transcription[offset:end], {
+        'offset': offset,
+        'length': end - offset,
+        'total_length': total,
+        'next_offset': end if end < total else None,
+    }
+
+# Format a summary result as the /summarize JSON response
+def summary_response(result, transcription, video_id, include_transcript=True,
+                     transcript_offset=0, transcript_limit=None):
+    payload = {
+        'video_id': video_id,
+        'category': result['category'].strip(),
+        'context': result['context'].strip(),
+        'summary': result['summary'].strip(),
+        'key_topics': result['key_topics'],
+        'key_notes': result['key_notes'],
+        'key_insights': result['key_insights'],
+        'summary_mode': result['summary_mode'],
+        'language': result['language'],
+    }
+    transcription = transcription.strip()
+    if not include_transcript:
+        payload['transcript_length'] = len(transcription)
+    elif transcript_offset or transcript_limit is not None:
+        payload['transcript'], payload['transcript_page'] = transcript_page(
+            transcription, transcript_offset, transcript_limit
+        )
+    else:
+        payload['transcript'] = transcription
+    return jsonify(payload)
+
+# ETag of a stored result as served with the given transcript options
+def result_etag(stored, include_transcript=True, transcript_offset=0, transcript_limit=None):
+    if not include_transcript:
+        return f"{stored.content_hash}-notranscript"
+    if transcript_offset or transcript_limit is not None:
+        return f"{stored.content_hash}-{transcript_offset}-{transcript_limit}"
+    return stored.content_hash
+
+# Respond with a stored result; a matching If-None-Match gets 304 without decoding the result
+def stored_response(stored, video_id, options):
+    etag = result_etag(stored, **options)
+    if request.if_none_match.contains_weak(etag):
+        response = app.response_class(status=304)
+    else:
+        response = summary_response(stored.to_result(), stored.get_transcript(), video_id, **options)
+    response.set_etag(etag, weak=True)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+# Shed load with a Retry-After hint when transcription is overloaded
+@app.errorhandler(Overloaded)
+def handle_overloaded(e):
+    response = jsonify({'error': str(e), 'retry_after': e.retry_after})
+    response.status_code = e.status_code
+    response.headers['Retry-After'] = str(e.retry_after)
+    return response
 
 # Flask route
 @app.route('/')
@@ -294,42 +588,57 @@ def index():
 def summarize_video():
     if 'url' in request.form:
         video_url = request.form['url']
+        video_id = extract_video_id(video_url)
         language = request.form.get('language', 'en')  # Default to English if not specified
         is_language_change = request.form.get('isLanguageChange') == 'true'
+        mode = request.form.get('mode', SUMMARY_MODE)
+        if mode not in SUMMARY_MODES:
+            return jsonify({'error': f"Unknown mode '{mode}'. Use one of: {', '.join(SUMMARY_MODES)}"}), 400
+        if mode == 'local' and language != LOCAL_SUMMARY_LANGUAGE:
+            return jsonify({'error': f"Local summaries are only available in '{LOCAL_SUMMARY_LANGUAGE}'"}), 400
+        options = transcript_options(request.values)
         
-        # If this is a language change request, we can skip the download and transcription
-        if is_language_change and 'currentContent' in request.form:
+        # Serve the stored result if this video was already processed in this language
+        try:
+            stored = find_result(video_id, language, stored_pipelines(mode))
+        except Exception as e:
+            stored = None
+            print(f"Error reading result store: {e}")
+        if stored:
+            print(f"Serving stored result for {video_id} ({language}, {stored.pipeline})")
+            response = summary_response(stored.to_result(), stored.get_transcript(), video_id, **options)
+            response.set_etag(result_etag(stored, **options), weak=True)
+            return response
+        
+        # Reuse the stored transcript of this video (e.g. from another language) if there is one
+        try:
+            transcription = find_transcript(video_id)
+        except Exception as e:
+            transcription = None
+            print(f"Error reading stored transcript: {e}")
+        
+        # If this is a language change request for a video that isn't stored, we can skip
+        # the download and transcription by using the transcript the frontend sent. That
+        # text comes from the client, so results built from it are never stored.
+        if transcription is None and is_language_change and 'currentContent' in request.form:
             try:
                 # Get the current content from the frontend
                 current_content = json.loads(request.form.get('currentContent', '{}'))
                 
                 # Check if we have the transcript already
-                if 'transcript' in current_content:
-                    transcription = current_content['transcript']
+                if current_content.get('transcript'):
+                    client_transcription = current_content['transcript']
                     print(f"Using existing transcript for language change to {language}")
                     
-                    # Generate new summary in the requested language
-                    summary = summarize_transcript(transcription, language)
+                    # Generate new summary, context and structured information in the
+                    # requested language (category is always in English)
+                    result = generate_summary_result(
+                        client_transcription, language, mode,
+                        category=current_content.get('category') or None
+                    )
                     print(f"Generated new summary in {language}")
                     
-                    # Extract structured information based on the new summary
-                    structured_info = extract_structured_info(summary, language)
-                    
-                    # Get category (category is always in English)
-                    category = current_content.get('category', '')
-                    
-                    # Generate context in the new language
-                    context = understand_context(transcription, language)
-                    
-                    return jsonify({
-                        'category': category.strip(),
-                        'context': context.strip(),
-                        'summary': summary.strip(),  # The new translated summary
-                        'key_topics': structured_info['key_topics'],
-                        'key_notes': structured_info['key_notes'],
-                        'key_insights': structured_info['key_insights'],
-                        'transcript': transcription.strip(),
-                    })
+                    return summary_response(result, client_transcription, video_id, **options)
             except Exception as e:
                 print(f"Error handling language change: {e}")
                 import traceback
@@ -337,27 +646,81 @@ def summarize_video():
                 # Fall back to normal processing if something goes wrong
         
         # Normal processing for new videos or if language change handling failed
-        audio_file = download_audio(video_url)
-        transcription = transcribe_audio(audio_file)
+        if transcription is None:
+            # Hold a transcription place before downloading, so a burst is turned away
+            # before any download or transcode starts
+            with transcription_admission.reserve() as reservation:
+                audio_file, duration = download_audio_with_duration(video_url)
+                with reservation.slot(duration):
+                    transcription, segments = transcribe_audio_segments(audio_file)
+            
+            # Keep the timestamped segments so moments in the video can be searched
+            if segments:
+                try:
+                    transcript_index.save_transcript(video_id, segments, url=video_url)
+                except Exception as e:
+                    print(f"Error indexing transcript segments: {e}")
 
-        category = detect_category(transcription)  # Always get category in English
-        context = understand_context(transcription, language)
-        summary = summarize_transcript(transcription, language)
-        
-        # Extract structured information from summary
-        structured_info = extract_structured_info(summary, language)
-        
-        return jsonify({
-            'category': category.strip(),
-            'context': context.strip(),
-            'summary': summary.strip(),
-            'key_topics': structured_info['key_topics'],
-            'key_notes': structured_info['key_notes'],
-            'key_insights': structured_info['key_insights'],
-            'transcript': transcription.strip(),
-        })
+        result = generate_summary_result(transcription, language, mode)
+        store_result(video_id, result, transcription)
+        return summary_response(result, transcription, video_id, **options)
     return jsonify({'error': 'No URL provided'})
 
+@app.route('/results/<video_id>', methods=['GET'])
+def get_video_result(video_id):
+    language = request.args.get('language', 'en')
+    mode = request.args.get('mode', SUMMARY_MODE)
+    if mode not in SUMMARY_MODES:
+        return jsonify({'error': f"Unknown mode '{mode}'. Use one of: {', '.join(SUMMARY_MODES)}"}), 400
+    
+    stored = find_result(video_id, language, stored_pipelines(mode))
+    if not stored:
+        return jsonify({'error': 'No stored result for this video and language'}), 404
+    return stored_response(stored, video_id, transcript_options(request.args))
+
+@app.route('/status/transcription', methods=['GET'])
+def transcription_status():
+    return jsonify(transcription_admission.stats())
+
+@app.route('/profiles', methods=['GET'])
+def list_profiles():
+    if not profiler.is_authorized(request):
+        return jsonify({'error': 'Not authorized'}), 403
+    return jsonify({'profiles': profiler.list_profiles()})
+
+@app.route('/profiles/<profile_id>', methods=['GET'])
+def get_profile(profile_id):
+    if not profiler.is_authorized(request):
+        return jsonify({'error': 'Not authorized'}), 403
+    profile = profiler.get(profile_id)
+    if profile is None:
+        return jsonify({'error': 'Unknown or expired profile'}), 404
+    
+    # Raw pstats data for pstats/snakeviz, or a text report sorted by cumulative time
+    if request.args.get('format') == 'pstats':
+        return Response(profile['stats'], mimetype='application/octet-stream', headers={
+            'Content-Disposition': f'attachment; filename={profile_id}.pstats'
+        })
+    return Response(profile['report'], mimetype='text/plain')
+
+@app.route('/search', methods=['GET'])
+def search_transcripts():
+    query = request.args.get('q', '').strip()
+    if not query:
+        return jsonify({'error': 'No query provided'}), 400
+    
+    video_id = request.args.get('video_id')
+    limit = min(max(request.args.get('limit', 20, type=int), 1), 100)
+    results = transcript_index.search(query, video_id=video_id, limit=limit)
+    return jsonify({'query': query, 'video_id': video_id, 'results': results})
+
+@app.route('/videos/<video_id>/segments', methods=['GET'])
+def get_video_segments(video_id):
+    segments = transcript_index.get_segments(video_id)
+    if not segments:
+        return jsonify({'error': 'No transcript segments stored for this video'}), 404
+    return jsonify({'video_id': video_id, 'segments': segments})
+
 @app.route('/chat', methods=['POST'])
 def handle_chat():
     data = request.json
@@ -375,6 +738,9 @@ def handle_chat():
     key_notes = context.get('keyNotes', [])
     key_insights = context.get('keyInsights', [])
     transcript = context.get('transcript', '')
+    if not transcript and data.get('video_id'):
+        # Clients may omit the transcript and let it be looked up from the result store
+        transcript = find_transcript(data['video_id']) or ''
     video_title = context.get('videoTitle', 'the video')
     
     # Prepare a prompt for Gemini to answer the question
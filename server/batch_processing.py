@@ -0,0 +1,92 @@
+"""
+Batch Processing Utilities
+
+Helpers for running TextPreprocessor / TranscriptAnalyzer methods over many
+texts in a process pool. NLTK tokenization is pure Python, so spreading
+documents across processes is what lets batch jobs use more than one core.
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+# Per-process instance created by the pool initializer
+_worker_state = {}
+
+
+def _init_worker(factory, factory_args):
+    """Build the worker's own instance once, when the process starts."""
+    _worker_state['instance'] = factory(*factory_args)
+
+
+def _run_chunk(method_name, chunk, method_kwargs):
+    """Apply the named method to every item of a chunk inside a worker."""
+    method = getattr(_worker_state['instance'], method_name)
+    return [method(item, **method_kwargs) for item in chunk]
+
+
+def _iter_chunks(items, chunksize):
+    """Group an iterable into lists of at most `chunksize` items."""
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= chunksize:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def process_in_pool(factory, factory_args, method_name, items,
+                    method_kwargs=None, workers=None, chunksize=16,
+                    max_pending=None):
+    """
+    Stream items through `method_name` of a per-process instance.
+
+    Inputs are read lazily and dispatched in chunks, and at most
+    `max_pending` chunks are in flight at once, so memory stays bounded
+    no matter how many items the iterable produces. Results are yielded
+    in input order.
+
+    Args:
+        factory (callable): Picklable callable building the instance (e.g. a class)
+        factory_args (tuple): Arguments passed to `factory` in each worker
+        method_name (str): Name of the method to call on each item
+        items (iterable): Input items (may be a generator)
+        method_kwargs (dict): Extra keyword arguments for the method
+        workers (int): Number of worker processes. Defaults to the CPU count;
+            1 runs everything in the current process
+        chunksize (int): Number of items sent to a worker per task
+        max_pending (int): Maximum chunks in flight. Defaults to 2 * workers
+
+    Yields:
+        The method's result for each item, in input order
+    """
+    method_kwargs = method_kwargs or {}
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, chunksize)
+
+    if workers <= 1:
+        instance = factory(*factory_args)
+        method = getattr(instance, method_name)
+        for item in items:
+            yield method(item, **method_kwargs)
+        return
+
+    max_pending = max_pending or 2 * workers
+    executor = ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(factory, factory_args)
+    )
+    pending = deque()
+    try:
+        for chunk in _iter_chunks(items, chunksize):
+            pending.append(executor.submit(_run_chunk, method_name, chunk, method_kwargs))
+            if len(pending) >= max_pending:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        # Runs on normal completion and when the consumer stops early
+        executor.shutdown(wait=True, cancel_futures=True)
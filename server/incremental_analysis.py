@@ -0,0 +1,181 @@
+"""
+Incremental Transcript Analysis
+
+Online counterpart of TranscriptAnalyzer for transcripts that arrive in
+segments (e.g. from segment-level Whisper transcription). Running term
+counts, a top-k keyword set, sentiment tallies and sentence-length
+statistics are updated as each segment arrives, so insights can be read
+at any time without reprocessing the text seen so far.
+"""
+
+import math
+import string
+from collections import Counter
+
+from text_preprocessing import TextPreprocessor
+from sentiment_lexicon import SentimentLexicon
+from transcript_analysis_utils import tag_cloud_from_counts
+
+SENTENCE_ENDINGS = ('.', '!', '?')
+
+
+class IncrementalTranscriptAnalyzer:
+    """
+    Maintains transcript insights while transcript segments stream in.
+    """
+
+    def __init__(self, language='english', top_k=30):
+        """
+        Initialize the incremental analyzer.
+
+        Args:
+            language (str): Language of the transcript
+            top_k (int): Number of top terms tracked for keywords and tag cloud
+        """
+        self.preprocessor = TextPreprocessor(language=language)
+        self.sentiment_lexicon = SentimentLexicon()
+        self.top_k = top_k
+
+        self.term_counts = Counter()
+        self._top_terms = {}
+        self._floor_term = None  # Lowest-count entry of _top_terms, None when stale
+        self._pending_text = ''
+
+        self.num_segments = 0
+        self.num_sentences = 0
+        self.num_words = 0
+        self.num_meaningful_words = 0
+        self.positive_count = 0
+        self.negative_count = 0
+        self._sentiment_total = 0.0
+
+        # Running sentence-length statistics (Welford's algorithm)
+        self._length_mean = 0.0
+        self._length_m2 = 0.0
+        self._min_length = 0
+        self._max_length = 0
+
+    def add_segment(self, text):
+        """
+        Add the next transcript segment.
+
+        Complete sentences are analyzed right away; a trailing partial
+        sentence is held back until the following segment completes it.
+
+        Args:
+            text (str): Segment text
+        """
+        self.num_segments += 1
+        text = f"{self._pending_text} {text}".strip()
+        sentences = self.preprocessor.tokenize_sentences(text)
+        if sentences and not sentences[-1].rstrip().endswith(SENTENCE_ENDINGS):
+            self._pending_text = sentences.pop()
+        else:
+            self._pending_text = ''
+
+        for sentence in sentences:
+            self._add_sentence(sentence)
+
+    def flush(self):
+        """Analyze any held-back partial sentence (call when the transcript ends)."""
+        if self._pending_text:
+            self._add_sentence(self._pending_text)
+            self._pending_text = ''
+
+    def _add_sentence(self, sentence):
+        """Update every running structure with one complete sentence."""
+        tokens = self.preprocessor.tokenize_words(sentence)
+        self._add_sentence_length(len(tokens))
+        self.num_words += len(tokens)
+
+        words = [token.lower() for token in tokens]
+        stop_words = self.preprocessor.stop_words
+        for word in words:
+            if word in string.punctuation:
+                continue
+            if word not in stop_words:
+                self.num_meaningful_words += 1
+                if len(word) > 1:
+                    self._count_term(word)
+
+        score, positive, negative = self.sentiment_lexicon.score_tokens(words)
+        self._sentiment_total += score
+        self.positive_count += positive
+        self.negative_count += negative
+
+    def _add_sentence_length(self, length):
+        """Update running sentence-length statistics."""
+        self.num_sentences += 1
+        delta = length - self._length_mean
+        self._length_mean += delta / self.num_sentences
+        self._length_m2 += delta * (length - self._length_mean)
+        if self.num_sentences == 1:
+            self._min_length = self._max_length = length
+        else:
+            self._min_length = min(self._min_length, length)
+            self._max_length = max(self._max_length, length)
+
+    def _count_term(self, term):
+        """
+        Increment a term count and keep the top-k set exact.
+
+        Every term outside the top-k set has a count no higher than the
+        set's lowest entry, so a term only needs to be checked against that
+        entry when its own count grows.
+        """
+        self.term_counts[term] += 1
+        count = self.term_counts[term]
+        top = self._top_terms
+
+        if term in top:
+            top[term] = count
+            if term == self._floor_term:
+                self._floor_term = None
+            return
+        if len(top) < self.top_k:
+            top[term] = count
+            self._floor_term = None
+            return
+
+        if self._floor_term is None:
+            self._floor_term = min(top, key=top.get)
+        if count > top[self._floor_term]:
+            del top[self._floor_term]
+            top[term] = count
+            self._floor_term = None
+
+    def snapshot(self, num_keywords=10, max_tags=20):
+        """
+        Current insights, computed from the running structures only.
+
+        Args:
+            num_keywords (int): Number of keywords to return (at most top_k)
+            max_tags (int): Number of tag cloud entries to return (at most top_k)
+
+        Returns:
+            dict: Insights in the same shape as TranscriptAnalyzer.extract_structured_insights
+        """
+        ranked = sorted(self._top_terms.items(), key=lambda item: item[1], reverse=True)
+        num_sentences = self.num_sentences
+
+        return {
+            'statistics': {
+                'num_sentences': num_sentences,
+                'num_words': self.num_words,
+                'num_meaningful_words': self.num_meaningful_words,
+                'avg_sentence_length': self._length_mean if num_sentences else 0,
+                'max_sentence_length': self._max_length,
+                'min_sentence_length': self._min_length,
+                'std_sentence_length': math.sqrt(self._length_m2 / num_sentences) if num_sentences else 0,
+            },
+            'keywords': [term for term, _ in ranked[:num_keywords]],
+            'sentiment': {
+                'positive_keywords': self.positive_count,
+                'negative_keywords': self.negative_count,
+                'sentiment_ratio': self.positive_count / max(1, self.negative_count),
+                'total_analyzed_keywords': self.positive_count + self.negative_count,
+                'overall_score': self._sentiment_total / num_sentences if num_sentences else 0.0
+            },
+            'tag_cloud': tag_cloud_from_counts(ranked[:max_tags]),
+            'segments_processed': self.num_segments,
+        }
@@ -0,0 +1,135 @@
+"""
+Local Summary
+
+Extractive, in-process alternative to the Gemini summarization pipeline.
+Builds the same fields /summarize returns (summary, context, key topics,
+notes and insights) from TranscriptAnalyzer output, without any network
+calls, so it can serve as a cheap tier or a fallback when Gemini is slow
+or unavailable.
+"""
+
+import numpy as np
+
+
+def _describe_sentiment(score):
+    """Turn an overall sentiment score in [-1, 1] into a short description."""
+    if score > 0.25:
+        return "positive"
+    if score > 0.05:
+        return "mildly positive"
+    if score < -0.25:
+        return "negative"
+    if score < -0.05:
+        return "mildly negative"
+    return "neutral"
+
+
+def _normalize(text):
+    """Comparison key for spotting repeated sentences or topics."""
+    return ' '.join(text.lower().split())
+
+
+def _unique(items):
+    """Drop repeated items, keeping the first occurrence."""
+    seen = set()
+    unique = []
+    for item in items:
+        key = _normalize(item)
+        if key not in seen:
+            seen.add(key)
+            unique.append(item)
+    return unique
+
+
+def _top_unique_sentences(index, scores, count, exclude=()):
+    """
+    The highest-scoring sentences, skipping repeats, in transcript order.
+
+    Args:
+        index (TermIndex): Term index of the transcript
+        scores (np.ndarray): Score of each sentence
+        count (int): Number of sentences to pick
+        exclude (list): Sentences that must not be picked again
+
+    Returns:
+        list: Picked sentences
+    """
+    seen = {_normalize(sentence) for sentence in exclude}
+    picked = []
+    for i in np.argsort(-scores, kind='stable'):
+        if len(picked) == count:
+            break
+        key = _normalize(index.sentences[i])
+        if key not in seen:
+            seen.add(key)
+            picked.append(i)
+    return [index.sentences[i] for i in sorted(picked)]
+
+
+def summarize_locally(analyzer, transcript, category=''):
+    """
+    Build a full summary result from the transcript alone.
+
+    Args:
+        analyzer (TranscriptAnalyzer): Analyzer for the transcript's language
+        transcript (str): Video transcript text
+        category (str): Category to report (already known, or '' if not)
+
+    Returns:
+        dict: category, context, summary, key_topics, key_notes and key_insights
+    """
+    index = analyzer.preprocessor.build_term_index(transcript)
+    num_sentences = index.num_sentences
+
+    # Summary: the most central sentences, in transcript order
+    summary_length = int(np.clip(num_sentences // 10, 3, 8))
+    summary_sentences = _top_unique_sentences(
+        index, analyzer.score_sentences(index, method='textrank'), summary_length
+    )
+
+    # Key topics: one line per topic segment, named by its keywords
+    segments = analyzer.identify_topic_segments(transcript, max_segments=5, index=index)
+    key_topics = _unique([
+        ', '.join(segment['keywords'][:3]).capitalize()
+        for segment in segments if segment['keywords']
+    ])
+
+    # Key notes: keyword-dense sentences not already used in the summary
+    key_notes = _top_unique_sentences(
+        index, analyzer.score_sentences(index, method='keywords'), 4, exclude=summary_sentences
+    )
+    if not key_notes:
+        key_notes = summary_sentences[:2]
+
+    keywords = index.top_terms(5)
+    sentiment = analyzer.analyze_sentiment_keywords(transcript, index=index, timeline_points=3)
+    key_insights = []
+    if keywords:
+        key_insights.append(f"The most discussed terms are: {', '.join(keywords)}.")
+    if len(key_topics) > 1:
+        key_insights.append(f"The video moves through {len(key_topics)} main topics.")
+    key_insights.append(
+        f"The overall tone is {_describe_sentiment(sentiment['overall_score'])}."
+    )
+    timeline = sentiment['timeline']
+    if len(timeline) > 1:
+        start_tone = _describe_sentiment(timeline[0]['score'])
+        end_tone = _describe_sentiment(timeline[-1]['score'])
+        if start_tone != end_tone:
+            key_insights.append(f"The tone shifts from {start_tone} at the start to {end_tone} by the end.")
+
+    summary = ' '.join(' '.join(sentence.split()) for sentence in summary_sentences)
+    context = '\n'.join(
+        ["Key Topics:"] + [f"- {topic}" for topic in key_topics]
+        + ["", "Key Notes:"] + [f"- {note}" for note in key_notes]
+        + ["", "Highlights:"] + [f"- {insight}" for insight in key_insights]
+    )
+
+    return {
+        'category': category,
+        'context': context,
+        'summary': summary,
+        'key_topics': key_topics or keywords,
+        'key_notes': key_notes,
+        'key_insights': key_insights,
+    }
@@ -0,0 +1,143 @@
+"""
+Result Store
+
+Durable store of processed videos, keyed by video ID, language and
+pipeline, so repeat requests are served with a single indexed lookup
+instead of re-running download, transcription and summarization. Large
+text fields are stored zlib-compressed.
+"""
+
+import hashlib
+import json
+import zlib
+from datetime import datetime, timezone
+
+from flask_sqlalchemy import SQLAlchemy
+
+db = SQLAlchemy()
+
+# Bump when the summarization pipeline changes so stale results are recomputed
+PIPELINE_VERSION = 1
+
+
+def pipeline_key(summary_mode):
+    """Pipeline identifier stored with a result, e.g. 'gemini-v1'."""
+    return f"{summary_mode}-v{PIPELINE_VERSION}"
+
+
+def _pack(value):
+    """JSON-encode and compress a value."""
+    return zlib.compress(json.dumps(value, ensure_ascii=False).encode('utf-8'))
+
+
+def _unpack(blob):
+    """Inverse of _pack."""
+    return json.loads(zlib.decompress(blob).decode('utf-8'))
+
+
+class VideoResult(db.Model):
+    """
+    Summarization result of one video in one language by one pipeline.
+    """
+    __tablename__ = 'video_results'
+    __table_args__ = (
+        db.UniqueConstraint('video_id', 'language', 'pipeline', name='uq_video_results_key'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    video_id = db.Column(db.String(255), nullable=False)
+    language = db.Column(db.String(16), nullable=False)
+    pipeline = db.Column(db.String(32), nullable=False)
+    category = db.Column(db.String(64), nullable=False, default='')
+    summary = db.Column(db.LargeBinary, nullable=False)
+    context = db.Column(db.LargeBinary, nullable=False)
+    structured_info = db.Column(db.LargeBinary, nullable=False)
+    transcript = db.Column(db.LargeBinary, nullable=False)
+    content_hash = db.Column(db.String(64), nullable=False)
+    created_at = db.Column(db.DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc))
+
+    def to_result(self):
+        """The stored result in the shape produced by the summarization pipeline."""
+        structured_info = _unpack(self.structured_info)
+        return {
+            'category': self.category,
+            'context': _unpack(self.context),
+            'summary': _unpack(self.summary),
+            'key_topics': structured_info['key_topics'],
+            'key_notes': structured_info['key_notes'],
+            'key_insights': structured_info['key_insights'],
+            'summary_mode': self.pipeline.split('-')[0],
+            'language': self.language,
+        }
+
+    def get_transcript(self):
+        """The stored transcript text."""
+        return _unpack(self.transcript)
+
+
+def find_result(video_id, language, pipelines):
+    """
+    Look up a stored result.
+
+    Args:
+        video_id (str): Video ID
+        language (str): Language code of the result
+        pipelines (list): Acceptable pipeline keys, most preferred first
+
+    Returns:
+        VideoResult: The stored result, or None
+    """
+    rows = VideoResult.query.filter(
+        VideoResult.video_id == video_id,
+        VideoResult.language == language,
+        VideoResult.pipeline.in_(pipelines)
+    ).all()
+    if not rows:
+        return None
+    return min(rows, key=lambda row: pipelines.index(row.pipeline))
+
+
+def find_transcript(video_id):
+    """
+    Any stored transcript of a video, whatever language or pipeline it was stored with.
+
+    Returns:
+        str: The transcript, or None
+    """
+    row = VideoResult.query.with_entities(VideoResult.transcript).filter_by(video_id=video_id).first()
+    return _unpack(row.transcript) if row else None
+
+
+def save_result(video_id, language, result, transcript):
+    """
+    Insert or replace the stored result for (video, language, pipeline).
+
+    Args:
+        video_id (str): Video ID
+        language (str): Language code of the result
+        result (dict): Pipeline result (category, context, summary, key_* lists, summary_mode, language)
+        transcript (str): Full transcript
+
+    Returns:
+        VideoResult: The stored row
+    """
+    pipeline = pipeline_key(result['summary_mode'])
+    structured_info = {key: result[key] for key in ('key_topics', 'key_notes', 'key_insights')}
+    content = json.dumps(
+        [result['category'], result['context'], result['summary'], structured_info, transcript],
+        ensure_ascii=False, sort_keys=True
+    )
+
+    row = VideoResult.query.filter_by(video_id=video_id, language=language, pipeline=pipeline).first()
+    if row is None:
+        row = VideoResult(video_id=video_id, language=language, pipeline=pipeline)
+        db.session.add(row)
+    row.category = result['category']
+    row.summary = _pack(result['summary'])
+    row.context = _pack(result['context'])
+    row.structured_info = _pack(structured_info)
+    row.transcript = _pack(transcript)
+    row.content_hash = hashlib.sha256(content.encode('utf-8')).hexdigest()
+    row.created_at = datetime.now(timezone.utc)
+    db.session.commit()
+    return row
@@ -0,0 +1,156 @@
+"""
+Request Profiling
+
+Opt-in cProfile profiling of individual Flask requests. A request sent
+with the X-Profile header (or a profile=1 query parameter) and a valid
+X-Profile-Token is run under the profiler; its stats are kept in memory
+under an ID returned in the X-Profile-Id response header. Only the most
+recent profiles are kept.
+"""
+
+import cProfile
+import hmac
+import io
+import marshal
+import pstats
+import secrets
+import threading
+import time
+from collections import OrderedDict
+
+from flask import g, request
+
+FLAG_VALUES = ('1', 'true', 'yes', 'on')
+
+
+class RequestProfiler:
+    """
+    Profiles flagged requests from authorized callers and keeps the latest results.
+    """
+
+    def __init__(self, token=None, max_profiles=20, report_lines=60):
+        """
+        Initialize the profiler.
+
+        Args:
+            token (str): Secret callers must send in X-Profile-Token (profiling is off without one)
+            max_profiles (int): Number of most recent profiles to keep
+            report_lines (int): Functions listed in the text report
+        """
+        self.token = token
+        self.max_profiles = max_profiles
+        self.report_lines = report_lines
+        self._profiles = OrderedDict()
+        self._store_lock = threading.Lock()
+        # Only one cProfile profiler can be active per process at a time
+        self._active = threading.Lock()
+
+    def init_app(self, app):
+        """Register the request hooks on a Flask app."""
+        app.before_request(self._start)
+        app.after_request(self._finish_response)
+        app.teardown_request(self._teardown)
+
+    def is_authorized(self, req):
+        """Whether a request carries the profiling token."""
+        if not self.token:
+            return False
+        supplied = req.headers.get('X-Profile-Token', '')
+        return hmac.compare_digest(supplied.encode('utf-8'), self.token.encode('utf-8'))
+
+    def is_requested(self, req):
+        """Whether a request asks to be profiled."""
+        flag = req.headers.get('X-Profile') or req.args.get('profile', '')
+        return flag.lower() in FLAG_VALUES
+
+    def _start(self):
+        if not self.is_requested(request):
+            return
+        if not self.is_authorized(request):
+            g.profile_status = 'unauthorized'
+            return
+        if not self._active.acquire(blocking=False):
+            g.profile_status = 'busy'
+            return
+
+        profile = cProfile.Profile()
+        g.profile = (profile, time.perf_counter())
+        try:
+            profile.enable()
+        except ValueError:
+            # Another profiling tool is already active in this process
+            del g.profile
+            self._active.release()
+            g.profile_status = 'busy'
+
+    def _stop(self, status_code=None):
+        # Stop the request's profiler, if any, and store its results
+        started = g.pop('profile', None)
+        if started is None:
+            return None
+        profile, start_time = started
+        profile.disable()
+        elapsed = time.perf_counter() - start_time
+        self._active.release()
+        return self._save(profile, elapsed, status_code)
+
+    def _finish_response(self, response):
+        profile_id = self._stop(response.status_code)
+        if profile_id:
+            response.headers['X-Profile-Id'] = profile_id
+        elif 'profile_status' in g:
+            response.headers['X-Profile-Status'] = g.profile_status
+        return response
+
+    def _teardown(self, exc):
+        # Requests that raised skip after_request; still stop and keep their profile
+        self._stop(500 if exc is not None else None)
+
+    def _save(self, profile, elapsed, status_code):
+        report = io.StringIO()
+        stats = pstats.Stats(profile, stream=report)
+        stats.sort_stats('cumulative').print_stats(self.report_lines)
+
+        profile_id = secrets.token_hex(8)
+        entry = {
+            'id': profile_id,
+            'method': request.method,
+            'path': request.full_path.rstrip('?'),
+            'status': status_code,
+            'duration_ms': round(elapsed * 1000, 1),
+            'created_at': time.time(),
+            'report': report.getvalue(),
+            'stats': marshal.dumps(stats.stats),
+        }
+        with self._store_lock:
+            self._profiles[profile_id] = entry
+            while len(self._profiles) > self.max_profiles:
+                self._profiles.popitem(last=False)
+        print(f"Stored profile {profile_id} for {entry['method']} {entry['path']} ({entry['duration_ms']} ms)")
+        return profile_id
+
+    def list_profiles(self):
+        """
+        Metadata of the stored profiles, newest first.
+
+        Returns:
+            list: {id, method, path, status, duration_ms, created_at} dictionaries
+        """
+        with self._store_lock:
+            entries = list(self._profiles.values())
+        return [
+            {key: value for key, value in entry.items() if key not in ('report', 'stats')}
+            for entry in reversed(entries)
+        ]
+
+    def get(self, profile_id):
+        """
+        A stored profile.
+
+        Returns:
+            dict: Metadata plus 'report' (text, sorted by cumulative time) and
+                'stats' (marshalled pstats data, loadable with pstats/snakeviz),
+                or None if it is unknown or expired
+        """
+        with self._store_lock:
+            return self._profiles.get(profile_id)
@@ -0,0 +1,226 @@
+"""
+Prompt Budget
+
+Compresses a transcript before it is embedded in an LLM prompt.
+Disfluencies and stuttered repeats are stripped, exact and near-identical
+sentences are dropped, low-information sentences are removed, and if the
+result is still over the token budget the highest-scoring sentences of each
+topic segment are kept so every part of the video stays represented.
+"""
+
+import math
+import re
+import numpy as np
+from scipy import sparse
+
+from sentence_graph import tfidf_matrix
+from sentiment_lexicon import NEGATORS
+from topic_segmentation import find_boundaries
+
+# A filler word with the whitespace before it and a comma after it; sentence-ending
+# punctuation is left in place
+FILLER_PATTERN = re.compile(r"\s*\b(?:u+m+|u+h+|e+r+m+|h+m+|a+h+)\b,?", re.IGNORECASE)
+# Words that are commonly stuttered in speech; other repeats ("had had", "that that")
+# can be meaningful and are kept
+STUTTER_WORDS = (
+    "i'm", "it's", 'i', 'a', 'an', 'the', 'and', 'but', 'so', 'we', 'you', 'it',
+    'to', 'of', 'in', 'like', 'just', 'well', 'okay', 'yeah',
+)
+REPEAT_PATTERN = re.compile(
+    r"\b(" + '|'.join(re.escape(word) for word in STUTTER_WORDS) + r")\b(?:[\s,]+\1\b)+",
+    re.IGNORECASE
+)
+NORMALIZE_PATTERN = re.compile(r"[^\w\s]")
+# Sentence ends that NLTK's sentence tokenizer doesn't split on (CJK punctuation)
+CJK_SENTENCE_END_PATTERN = re.compile(r"(?<=[。！？])")
+
+
+def estimate_tokens(text):
+    """Rough LLM token count (about four characters per token)."""
+    return math.ceil(len(text) / 4)
+
+
+def clean_sentence(sentence):
+    """Strip filler words, stuttered repeats and extra whitespace from a sentence."""
+    sentence = FILLER_PATTERN.sub('', sentence)
+    sentence = REPEAT_PATTERN.sub(r'\1', sentence)
+    return ' '.join(sentence.split())
+
+
+def split_long_sentence(sentence, max_tokens):
+    """
+    Split a sentence into pieces of at most max_tokens.
+
+    Long "sentences" come from text the sentence tokenizer can't split, such
+    as unpunctuated transcripts or CJK text. They are split at CJK sentence
+    ends first, then into runs of whole words, and words longer than a
+    piece (text without spaces) into character windows.
+
+    Args:
+        sentence (str): Sentence text
+        max_tokens (int): Maximum estimated tokens per piece
+
+    Returns:
+        list: Pieces of the sentence, in order
+    """
+    max_chars = max_tokens * 4
+    if len(sentence) <= max_chars:
+        return [sentence]
+
+    pieces = []
+    for part in CJK_SENTENCE_END_PATTERN.split(sentence):
+        part = part.strip()
+        if len(part) <= max_chars:
+            if part:
+                pieces.append(part)
+            continue
+        window, length = [], 0
+        for word in part.split():
+            for start in range(0, len(word), max_chars):
+                chunk = word[start:start + max_chars]
+                if window and length + len(chunk) > max_chars:
+                    pieces.append(' '.join(window))
+                    window, length = [], 0
+                window.append(chunk)
+                length += len(chunk) + 1
+        if window:
+            pieces.append(' '.join(window))
+    return pieces
+
+
+def duplicate_mask(index, threshold=0.9, window=5):
+    """
+    Flag sentences that repeat an earlier one.
+
+    Exact repeats are found anywhere in the text; near-identical sentences
+    (cosine similarity >= threshold) within `window` sentences. Near
+    duplicates are compared on all their words, stopwords included, and must
+    contain the same number of negations, so "is safe" and "is not safe"
+    are never merged.
+
+    Args:
+        index (TermIndex): Term index of the text
+        threshold (float): Similarity at which sentences count as duplicates
+        window (int): How many preceding sentences to compare against
+
+    Returns:
+        np.ndarray: True for each sentence that duplicates an earlier one
+    """
+    num_sentences = index.num_sentences
+    duplicates = np.zeros(num_sentences, dtype=bool)
+
+    seen = set()
+    for i, sentence in enumerate(index.sentences):
+        key = ' '.join(NORMALIZE_PATTERN.sub('', sentence.lower()).split())
+        if key in seen:
+            duplicates[i] = True
+        seen.add(key)
+
+    counts = index.counts[:, np.flatnonzero(~index.is_punctuation)]
+    norms = np.sqrt(np.asarray(counts.multiply(counts).sum(axis=1)).ravel())
+    vectors = sparse.diags(1 / np.maximum(norms, 1e-12)) @ counts
+    is_negator = np.array([term in NEGATORS for term in index.terms], dtype=bool)
+    negations = np.asarray(index.counts[:, np.flatnonzero(is_negator)].sum(axis=1)).ravel()
+
+    for distance in range(1, min(window, num_sentences - 1) + 1):
+        similarities = np.asarray(vectors[:-distance].multiply(vectors[distance:]).sum(axis=1)).ravel()
+        duplicates[distance:] |= (similarities >= threshold) & (negations[:-distance] == negations[distance:])
+    return duplicates
+
+
+def _select_within_budget(candidates, scores, costs, budget):
+    """Greedily take the best-scoring candidates that still fit the budget."""
+    selected = []
+    for i in sorted(candidates, key=lambda i: -scores[i]):
+        if costs[i] <= budget:
+            selected.append(i)
+            budget -= costs[i]
+    return selected, budget
+
+
+def compress_transcript(analyzer, transcript, token_budget=4000, max_segments=8,
+                        min_content_terms=2, duplicate_threshold=0.9, max_sentence_tokens=None):
+    """
+    Compress a transcript to fit a prompt token budget.
+
+    Args:
+        analyzer (TranscriptAnalyzer): Analyzer for the transcript's language
+        transcript (str): Video transcript text
+        token_budget (int): Target maximum number of tokens
+        max_segments (int): Number of topic segments to keep coverage across
+        min_content_terms (int): When over budget, sentences with fewer content
+            terms are dropped first
+        duplicate_threshold (float): Similarity at which sentences count as duplicates
+        max_sentence_tokens (int): Longer sentences are split into pieces before
+            selection (default: an eighth of a segment's share of the budget)
+
+    Returns:
+        tuple: (compressed transcript, stats dict with original_tokens,
+            compressed_tokens, ratio, sentences and kept_sentences)
+    """
+    preprocessor = analyzer.preprocessor
+    if max_sentence_tokens is None:
+        max_sentence_tokens = max(16, token_budget // (8 * max_segments))
+    sentences = [
+        piece for sentence in preprocessor.tokenize_sentences(transcript)
+        for piece in split_long_sentence(sentence, max_sentence_tokens)
+    ]
+    index = preprocessor.index_sentences(sentences)
+    num_sentences = index.num_sentences
+    original_tokens = estimate_tokens(transcript)
+    if num_sentences == 0:
+        return transcript, {
+            'original_tokens': original_tokens, 'compressed_tokens': original_tokens,
+            'ratio': 1.0, 'sentences': 0, 'kept_sentences': 0,
+        }
+
+    cleaned = [clean_sentence(sentence) for sentence in index.sentences]
+    costs = np.array([estimate_tokens(sentence) + 1 for sentence in cleaned])
+    scores = analyzer.score_sentences(index, method='textrank')
+
+    # Drop repeated sentences
+    keep = ~duplicate_mask(index, duplicate_threshold) & np.array([bool(sentence) for sentence in cleaned])
+
+    # Over budget: drop low-information sentences, then spread the budget over
+    # topic segments by their size
+    if costs[keep].sum() > token_budget:
+        informative = keep & (np.diff(tfidf_matrix(index).indptr) >= min_content_terms)
+        if informative.any():
+            keep = informative
+        boundaries = find_boundaries(index, max_segments=max_segments)
+        starts = [0] + boundaries
+        ends = boundaries + [num_sentences]
+        total_cost = costs[keep].sum()
+
+        selected = []
+        leftover = 0
+        for start, end in zip(starts, ends):
+            candidates = [i for i in range(start, end) if keep[i]]
+            share = token_budget * costs[candidates].sum() / total_cost
+            picked, remaining = _select_within_budget(candidates, scores, costs, share)
+            selected += picked
+            leftover += remaining
+
+        # Spend what the segments left over on the best remaining sentences
+        remaining_candidates = sorted(set(np.flatnonzero(keep)) - set(selected))
+        picked, _ = _select_within_budget(remaining_candidates, scores, costs, leftover)
+        selected += picked
+
+        if not selected:
+            # Nothing fits: keep the best sentence, truncated to the budget
+            best = max(np.flatnonzero(keep), key=lambda i: scores[i])
+            cleaned[best] = cleaned[best][:token_budget * 4].rstrip()
+            selected = [best]
+
+        keep = np.zeros(num_sentences, dtype=bool)
+        keep[selected] = True
+
+    compressed = ' '.join(cleaned[i] for i in np.flatnonzero(keep))
+    compressed_tokens = estimate_tokens(compressed)
+    return compressed, {
+        'original_tokens': original_tokens,
+        'compressed_tokens': compressed_tokens,
+        'ratio': compressed_tokens / max(1, original_tokens),
+        'sentences': num_sentences,
+        'kept_sentences': int(keep.sum()),
+    }
@@ -0,0 +1,82 @@
+"""
+Response Compression
+
+Compresses Flask responses with brotli (when the brotli package is
+installed) or gzip, whichever the client accepts, so large JSON payloads
+such as full transcripts cost a fraction of their size on the wire.
+"""
+
+import gzip
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESSIBLE_TYPES = ('application/json', 'text/html', 'text/css', 'text/plain', 'application/javascript')
+
+
+def choose_encoding(accept_encodings):
+    """
+    Pick the best content encoding the client accepts.
+
+    Args:
+        accept_encodings (werkzeug.datastructures.Accept): Parsed Accept-Encoding header
+
+    Returns:
+        str: 'br', 'gzip' or None
+    """
+    candidates = (['br'] if brotli is not None else []) + ['gzip']
+    for encoding in candidates:
+        if accept_encodings[encoding] > 0:
+            return encoding
+    return None
+
+
+def compress_body(data, encoding, level=6):
+    """
+    Compress a response body.
+
+    Args:
+        data (bytes): Uncompressed body
+        encoding (str): 'br' or 'gzip'
+        level (int): gzip level (1-9); brotli quality is derived from it
+
+    Returns:
+        bytes: Compressed body
+    """
+    if encoding == 'br':
+        return brotli.compress(data, quality=min(11, level - 1))
+    return gzip.compress(data, compresslevel=level)
+
+
+def init_compression(app, min_size=1024, level=6):
+    """
+    Compress the app's responses when the client supports it.
+
+    Args:
+        app (Flask): Application to register the hook on
+        min_size (int): Bodies smaller than this (in bytes) are sent as is
+        level (int): Compression level (1-9)
+    """
+    from flask import request
+
+    @app.after_request
+    def compress_response(response):
+        if (response.direct_passthrough or response.status_code < 200
+                or response.status_code in (204, 206, 304)
+                or 'Content-Encoding' in response.headers
+                or response.mimetype not in COMPRESSIBLE_TYPES):
+            return response
+
+        response.vary.add('Accept-Encoding')
+        data = response.get_data()
+        encoding = choose_encoding(request.accept_encodings)
+        if encoding is None or len(data) < min_size:
+            return response
+
+        response.set_data(compress_body(data, encoding, level))
+        response.headers['Content-Encoding'] = encoding
+        return response
+
+    return compress_response
@@ -0,0 +1,181 @@
+"""
+Sentence Graph Ranking
+
+TextRank/LexRank-style sentence ranking over a TermIndex.
+Sentences are embedded as TF-IDF vectors, connected to a bounded set of
+neighbours (a sliding window of nearby sentences plus sentences sharing a
+locality-sensitive hash bucket), and ranked by power iteration. Each
+sentence only ever gets a bounded number of edges, so the cost grows
+linearly with transcript length instead of quadratically.
+"""
+
+import numpy as np
+from scipy import sparse
+
+
+def tfidf_matrix(index):
+    """
+    Build L2-normalized TF-IDF sentence vectors over content terms.
+
+    Args:
+        index (TermIndex): Term index of the text
+
+    Returns:
+        scipy.sparse.csr_matrix: Sentence-by-term TF-IDF matrix
+    """
+    counts = index.counts
+    num_sentences = counts.shape[0]
+    doc_freq = np.bincount(counts.indices, minlength=counts.shape[1])
+    idf = np.log((1 + num_sentences) / (1 + doc_freq)) + 1
+    idf[~index.is_content] = 0
+
+    tfidf = counts @ sparse.diags(idf)
+    norms = np.sqrt(np.asarray(tfidf.multiply(tfidf).sum(axis=1)).ravel())
+    norms[norms == 0] = 1
+    return sparse.csr_matrix(sparse.diags(1 / norms) @ tfidf)
+
+
+def _window_pairs(num_sentences, window):
+    """Pairs (i, i + d) for every sentence and every distance d <= window."""
+    rows, cols = [], []
+    for distance in range(1, min(window, num_sentences - 1) + 1):
+        starts = np.arange(num_sentences - distance)
+        rows.append(starts)
+        cols.append(starts + distance)
+    return rows, cols
+
+
+def _lsh_pairs(vectors, num_bits, num_tables, max_bucket, seed):
+    """Pairs of sentences that land in the same random-hyperplane hash bucket."""
+    rows, cols = [], []
+    num_sentences, num_terms = vectors.shape
+    rng = np.random.default_rng(seed)
+    weights = 1 << np.arange(num_bits, dtype=np.int64)
+    pair_cache = {}
+
+    for _ in range(num_tables):
+        planes = rng.standard_normal((num_terms, num_bits))
+        signatures = (np.asarray(vectors @ planes) > 0) @ weights
+        # Sentences without any content terms would all collide in one bucket
+        signatures[vectors.getnnz(axis=1) == 0] = -1
+
+        order = np.argsort(signatures, kind='stable')
+        sorted_signatures = signatures[order]
+        bucket_starts = np.flatnonzero(np.r_[True, sorted_signatures[1:] != sorted_signatures[:-1]])
+        bucket_ends = np.r_[bucket_starts[1:], num_sentences]
+
+        for start, end in zip(bucket_starts, bucket_ends):
+            if sorted_signatures[start] < 0:
+                continue
+            # Split oversized buckets so each sentence keeps a bounded degree
+            for chunk_start in range(start, end, max_bucket):
+                members = order[chunk_start:min(chunk_start + max_bucket, end)]
+                if len(members) < 2:
+                    continue
+                size = len(members)
+                if size not in pair_cache:
+                    pair_cache[size] = np.triu_indices(size, k=1)
+                left, right = pair_cache[size]
+                rows.append(members[left])
+                cols.append(members[right])
+    return rows, cols
+
+
+def similarity_graph(vectors, window=3, lsh_bits=12, lsh_tables=2, max_bucket=8, seed=0):
+    """
+    Build a sparse, symmetric cosine-similarity graph between sentences.
+
+    Args:
+        vectors (scipy.sparse.csr_matrix): L2-normalized sentence vectors
+        window (int): Connect each sentence to this many following sentences
+        lsh_bits (int): Hyperplanes per LSH table (0 disables LSH neighbours)
+        lsh_tables (int): Number of LSH tables
+        max_bucket (int): Maximum sentences connected together per bucket
+        seed (int): Random seed for the hyperplanes
+
+    Returns:
+        scipy.sparse.csr_matrix: Weighted adjacency matrix
+    """
+    num_sentences = vectors.shape[0]
+    if num_sentences < 2:
+        return sparse.csr_matrix((num_sentences, num_sentences))
+
+    rows, cols = _window_pairs(num_sentences, window)
+    if lsh_bits > 0 and lsh_tables > 0:
+        lsh_rows, lsh_cols = _lsh_pairs(vectors, lsh_bits, lsh_tables, max_bucket, seed)
+        rows += lsh_rows
+        cols += lsh_cols
+
+    if not rows:
+        return sparse.csr_matrix((num_sentences, num_sentences))
+
+    rows = np.concatenate(rows)
+    cols = np.concatenate(cols)
+    # Normalize to i < j and drop pairs found by more than one strategy
+    low, high = np.minimum(rows, cols), np.maximum(rows, cols)
+    keys = np.sort(low.astype(np.int64) * num_sentences + high)
+    keys = keys[np.r_[True, keys[1:] != keys[:-1]]]
+    low, high = keys // num_sentences, keys % num_sentences
+
+    similarities = np.asarray(vectors[low].multiply(vectors[high]).sum(axis=1)).ravel()
+    keep = similarities > 0
+    low, high, similarities = low[keep], high[keep], similarities[keep]
+
+    graph = sparse.coo_matrix(
+        (np.r_[similarities, similarities], (np.r_[low, high], np.r_[high, low])),
+        shape=(num_sentences, num_sentences)
+    )
+    return graph.tocsr()
+
+
+def power_iteration(graph, damping=0.85, tol=1e-6, max_iter=100):
+    """
+    Rank graph nodes with PageRank-style power iteration.
+
+    Args:
+        graph (scipy.sparse.csr_matrix): Weighted adjacency matrix
+        damping (float): Damping factor
+        tol (float): L1 convergence tolerance
+        max_iter (int): Maximum number of iterations
+
+    Returns:
+        np.ndarray: Rank of each node (sums to 1)
+    """
+    num_nodes = graph.shape[0]
+    if num_nodes == 0:
+        return np.zeros(0)
+
+    out_weight = np.asarray(graph.sum(axis=1)).ravel()
+    dangling = out_weight == 0
+    out_weight[dangling] = 1
+    transition = sparse.csr_matrix((sparse.diags(1 / out_weight) @ graph).T)
+
+    ranks = np.full(num_nodes, 1 / num_nodes)
+    for _ in range(max_iter):
+        # Isolated sentences spread their rank uniformly
+        spread = ranks[dangling].sum() / num_nodes
+        updated = (1 - damping) / num_nodes + damping * (transition @ ranks + spread)
+        converged = np.abs(updated - ranks).sum() < tol
+        ranks = updated
+        if converged:
+            break
+    return ranks
+
+
+def textrank_scores(index, window=3, lsh_bits=12, lsh_tables=2, max_bucket=8):
+    """
+    Score sentences by their centrality in the sentence-similarity graph.
+
+    Args:
+        index (TermIndex): Term index of the text
+        window (int): Sliding-window neighbours per sentence
+        lsh_bits (int): Hyperplanes per LSH table (0 disables LSH neighbours)
+        lsh_tables (int): Number of LSH tables
+        max_bucket (int): Maximum sentences connected together per bucket
+
+    Returns:
+        np.ndarray: Score for each sentence
+    """
+    vectors = tfidf_matrix(index)
+    graph = similarity_graph(vectors, window, lsh_bits, lsh_tables, max_bucket)
+    return power_iteration(graph)
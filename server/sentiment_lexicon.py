@@ -0,0 +1,240 @@
+"""
+Sentiment Lexicon
+
+Weighted lexicon sentiment scoring over a TermIndex.
+The lexicon is compiled once per text into per-term weight arrays, so every
+token is scored with array lookups; negators ("not", "never", "n't") flip
+the words that follow them, and intensifiers ("very", "slightly") scale the
+next word. Sentence scores are aggregated with bincount and smoothed into a
+timeline across the transcript.
+"""
+
+import math
+import numpy as np
+
+# Word weights on a -3 (very negative) to +3 (very positive) scale.
+# Common inflections are listed explicitly so no lemmatization is needed.
+SENTIMENT_WEIGHTS = {
+    # Positive
+    'good': 1.9, 'great': 3.1, 'excellent': 2.7, 'amazing': 2.8, 'awesome': 3.1,
+    'fantastic': 2.6, 'wonderful': 2.7, 'brilliant': 2.8, 'outstanding': 2.8,
+    'perfect': 2.7, 'best': 3.2, 'better': 1.9, 'nice': 1.8, 'love': 3.2,
+    'loved': 2.9, 'loves': 2.7, 'enjoy': 2.2, 'enjoyed': 2.3, 'happy': 2.7, 'glad': 2.0, 'excited': 1.8, 'exciting': 2.2,
+    'interesting': 1.7, 'beneficial': 1.9, 'benefit': 2.0, 'benefits': 1.6,
+    'positive': 2.3, 'advantage': 1.0, 'advantages': 1.0, 'helpful': 1.8,
+    'useful': 1.9, 'valuable': 2.1, 'improve': 1.9, 'improves': 1.8,
+    'improved': 2.1, 'improving': 1.8, 'improvement': 2.0, 'success': 2.7,
+    'successful': 2.8, 'successfully': 2.5, 'effective': 2.1, 'efficient': 1.8,
+    'recommended': 1.5, 'recommend': 1.5, 'easy': 1.9, 'simple': 1.0,
+    'powerful': 1.8, 'impressive': 2.3, 'promising': 1.7, 'strong': 1.6,
+    'win': 2.8, 'wins': 2.7, 'won': 2.7, 'winning': 2.4, 'gain': 2.4,
+    'gains': 1.8, 'growth': 1.6, 'accurate': 1.5, 'reliable': 1.9,
+    'safe': 1.9, 'clear': 1.6, 'fun': 2.3, 'beautiful': 2.9, 'thanks': 1.9,
+    'thank': 1.5, 'solve': 0.8, 'solved': 1.1, 'solution': 1.3, 'solutions': 1.3,
+    'accessible': 1.2, 'opportunity': 1.8, 'opportunities': 1.6,
+    # Negative
+    'bad': -2.5, 'poor': -2.1, 'terrible': -2.1, 'awful': -2.0, 'horrible': -2.5,
+    'worse': -2.1, 'worst': -3.1, 'negative': -2.7, 'disadvantage': -1.8,
+    'disadvantages': -1.6, 'harmful': -2.6, 'harm': -2.5, 'hate': -2.7,
+    'hated': -3.2, 'dislike': -1.6, 'fail': -2.5, 'fails': -1.8, 'failed': -2.3,
+    'failing': -2.3, 'failure': -2.3, 'failures': -2.0, 'ineffective': -0.5,
+    'inefficient': -1.0, 'problem': -1.7, 'problems': -1.7, 'issue': -0.8,
+    'issues': -0.8, 'difficult': -1.5, 'hard': -0.4, 'challenging': -0.6,
+    'wrong': -2.1, 'error': -1.7, 'errors': -1.4, 'mistake': -1.4,
+    'mistakes': -1.3, 'risk': -1.1, 'risks': -0.8, 'risky': -1.4,
+    'dangerous': -2.1, 'danger': -2.4, 'loss': -1.3, 'losses': -1.7,
+    'lose': -1.7, 'lost': -1.3, 'sad': -2.1, 'angry': -2.3, 'afraid': -2.2,
+    'worried': -1.2, 'worry': -1.9, 'concern': -0.4, 'concerns': -0.7,
+    'confusing': -1.3, 'boring': -1.3, 'broken': -1.4, 'crisis': -3.1,
+    'weak': -1.9, 'slow': -0.8, 'expensive': -0.8, 'unfortunately': -1.8,
+    'unsafe': -2.1, 'useless': -1.8, 'annoying': -1.7, 'struggle': -1.9,
+    'struggling': -1.9, 'threat': -2.4, 'decline': -1.1, 'damage': -2.2,
+}
+
+NEGATORS = frozenset([
+    'not', 'no', 'never', "n't", 'nt', 'cannot', 'without', 'nothing',
+    'nobody', 'none', 'neither', 'nor', 'hardly', 'barely', 'rarely',
+])
+
+INTENSIFIERS = {
+    'very': 1.3, 'really': 1.3, 'extremely': 1.5, 'incredibly': 1.5,
+    'absolutely': 1.4, 'totally': 1.3, 'highly': 1.3, 'so': 1.2, 'too': 1.2,
+    'truly': 1.3, 'quite': 1.1, 'pretty': 1.1, 'slightly': 0.7,
+    'somewhat': 0.8, 'kind': 0.8, 'little': 0.8,
+}
+
+
+class SentimentLexicon:
+    """
+    Weighted sentiment lexicon with negation and intensifier handling.
+    """
+
+    def __init__(self, weights=None, negators=None, intensifiers=None,
+                 negation_scope=3, negation_scalar=-0.74, normalization_alpha=15):
+        """
+        Initialize the lexicon.
+
+        Args:
+            weights (dict): Word to sentiment weight mapping
+            negators (set): Words that flip the sentiment of the words after them
+            intensifiers (dict): Word to multiplier applied to the next word
+            negation_scope (int): Number of tokens a negator affects
+            negation_scalar (float): Multiplier applied to negated words
+            normalization_alpha (float): Smoothing constant mapping raw scores to [-1, 1]
+        """
+        self.weights = SENTIMENT_WEIGHTS if weights is None else weights
+        self.negators = NEGATORS if negators is None else frozenset(negators)
+        self.intensifiers = INTENSIFIERS if intensifiers is None else intensifiers
+        self.negation_scope = negation_scope
+        self.negation_scalar = negation_scalar
+        self.normalization_alpha = normalization_alpha
+
+    def normalize(self, raw_score):
+        """Map a raw sentence score to the range [-1, 1]."""
+        return raw_score / np.sqrt(raw_score * raw_score + self.normalization_alpha)
+
+    def compile(self, index):
+        """
+        Compile the lexicon against a term index's vocabulary.
+
+        Args:
+            index (TermIndex): Term index of the text
+
+        Returns:
+            tuple: (weight, is_negator, intensity) arrays indexed by term ID
+        """
+        weights = np.array([self.weights.get(term, 0.0) for term in index.terms], dtype=np.float64)
+        is_negator = np.array([term in self.negators for term in index.terms], dtype=bool)
+        intensity = np.array([self.intensifiers.get(term, 1.0) for term in index.terms], dtype=np.float64)
+        return weights, is_negator, intensity
+
+    def token_scores(self, index):
+        """
+        Effective sentiment weight of every token in the text.
+
+        Args:
+            index (TermIndex): Term index of the text
+
+        Returns:
+            np.ndarray: Weight of each token after negation and intensifiers
+        """
+        token_ids = index.token_ids
+        if len(token_ids) == 0:
+            return np.zeros(0)
+        weights, is_negator, intensity = self.compile(index)
+
+        positions = np.arange(len(token_ids))
+        sentence_starts = index.sentence_offsets[index.sentence_ids]
+
+        # Negators within the preceding `negation_scope` tokens of the same sentence
+        negator_prefix = np.concatenate(([0], np.cumsum(is_negator[token_ids])))
+        window_start = np.maximum(positions - self.negation_scope, sentence_starts)
+        negated = negator_prefix[positions] - negator_prefix[window_start] > 0
+
+        # Intensifier immediately before the token, within the same sentence
+        multiplier = np.ones(len(token_ids))
+        has_previous = positions > sentence_starts
+        multiplier[has_previous] = intensity[token_ids[positions[has_previous] - 1]]
+
+        scores = weights[token_ids] * multiplier
+        return np.where(negated, scores * self.negation_scalar, scores)
+
+    def sentence_scores(self, index, token_scores=None):
+        """
+        Normalized sentiment score of every sentence.
+
+        Args:
+            index (TermIndex): Term index of the text
+            token_scores (np.ndarray): Precomputed token scores (optional)
+
+        Returns:
+            np.ndarray: Score in [-1, 1] for each sentence
+        """
+        if token_scores is None:
+            token_scores = self.token_scores(index)
+        raw = np.bincount(index.sentence_ids, weights=token_scores, minlength=index.num_sentences)
+        return self.normalize(raw)
+
+    def timeline(self, sentence_scores, points=20, smoothing=3):
+        """
+        Smoothed sentiment timeline across the text.
+
+        Args:
+            sentence_scores (np.ndarray): Score of each sentence
+            points (int): Maximum number of timeline points
+            smoothing (int): Moving-average width in points
+
+        Returns:
+            list: {position, score} dictionaries; position is the fraction of
+                the text (0-1) where the point starts
+        """
+        num_sentences = len(sentence_scores)
+        if num_sentences == 0:
+            return []
+        points = min(points, num_sentences)
+
+        buckets = np.arange(num_sentences) * points // num_sentences
+        means = np.bincount(buckets, weights=sentence_scores, minlength=points) / np.bincount(buckets, minlength=points)
+
+        kernel = np.ones(max(1, min(smoothing, points)))
+        smoothed = np.convolve(means, kernel, mode='same') / np.convolve(np.ones(points), kernel, mode='same')
+        return [
+            {'position': i / points, 'score': float(score)}
+            for i, score in enumerate(smoothed)
+        ]
+
+    def score_tokens(self, tokens):
+        """
+        Score a single tokenized sentence without a term index.
+
+        Args:
+            tokens (list): Lowercased word tokens of the sentence
+
+        Returns:
+            tuple: (normalized score, positive word count, negative word count)
+        """
+        raw = 0.0
+        positive = negative = 0
+        last_negator = -math.inf
+        for position, token in enumerate(tokens):
+            if token in self.negators:
+                last_negator = position
+            weight = self.weights.get(token)
+            if not weight:
+                continue
+            if position > 0:
+                weight *= self.intensifiers.get(tokens[position - 1], 1.0)
+            if position - last_negator <= self.negation_scope:
+                weight *= self.negation_scalar
+            raw += weight
+            if weight > 0:
+                positive += 1
+            else:
+                negative += 1
+        return float(self.normalize(raw)), positive, negative
+
+    def analyze(self, index, timeline_points=20, smoothing=3):
+        """
+        Full sentiment analysis of a text.
+
+        Args:
+            index (TermIndex): Term index of the text
+            timeline_points (int): Maximum number of timeline points
+            smoothing (int): Moving-average width of the timeline
+
+        Returns:
+            dict: Sentiment word counts, overall score and timeline
+        """
+        token_scores = self.token_scores(index)
+        sentence_scores = self.sentence_scores(index, token_scores)
+        positive_count = int(np.count_nonzero(token_scores > 0))
+        negative_count = int(np.count_nonzero(token_scores < 0))
+
+        return {
+            'positive_keywords': positive_count,
+            'negative_keywords': negative_count,
+            'sentiment_ratio': positive_count / max(1, negative_count),
+            'total_analyzed_keywords': positive_count + negative_count,
+            'overall_score': float(sentence_scores.mean()) if len(sentence_scores) else 0.0,
+            'timeline': self.timeline(sentence_scores, timeline_points, smoothing),
+        }
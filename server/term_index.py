@@ -0,0 +1,168 @@
+"""
+Term Index
+
+Shared vocabulary / term-count layer for transcript analysis.
+A text is tokenized once; tokens are mapped to integer IDs held in a NumPy
+array and per-sentence term counts are kept in a sparse sentence-by-term
+matrix, so keyword densities and sentence scores are computed with
+vectorized operations instead of repeated list and substring scans.
+"""
+
+import string
+import numpy as np
+from scipy import sparse
+
+
+class TermIndex:
+    """
+    Vocabulary, token ID array and sentence-by-term count matrix for a text.
+    """
+
+    def __init__(self, sentences, tokenized_sentences, stop_words):
+        """
+        Build the index from pre-tokenized sentences.
+
+        Args:
+            sentences (list): Original sentence strings
+            tokenized_sentences (list): Lowercased word tokens for each sentence
+            stop_words (set): Stopwords for the text's language
+        """
+        self.sentences = sentences
+        self.vocabulary = {}
+        token_ids = []
+        for tokens in tokenized_sentences:
+            for token in tokens:
+                token_ids.append(self.vocabulary.setdefault(token, len(self.vocabulary)))
+        # IDs are assigned in first-occurrence order, so terms[i] is the i-th new term
+        self.terms = list(self.vocabulary)
+
+        num_sentences = len(sentences)
+        num_terms = len(self.terms)
+        lengths = np.array([len(tokens) for tokens in tokenized_sentences], dtype=np.int64)
+
+        self.token_ids = np.array(token_ids, dtype=np.int32)
+        self.sentence_offsets = np.concatenate(([0], np.cumsum(lengths)))
+        self.sentence_ids = np.repeat(np.arange(num_sentences), lengths)
+
+        # Duplicate (sentence, term) entries are summed into counts
+        self.counts = sparse.csr_matrix(
+            (np.ones(len(token_ids), dtype=np.float64), (self.sentence_ids, self.token_ids)),
+            shape=(num_sentences, num_terms)
+        )
+        self.term_totals = np.bincount(self.token_ids, minlength=num_terms)
+
+        punctuation = set(string.punctuation)
+        self.is_stopword = np.array([term in stop_words for term in self.terms], dtype=bool)
+        self.is_punctuation = np.array(
+            [all(ch in punctuation for ch in term) for term in self.terms], dtype=bool
+        )
+        # Terms eligible as keywords: not stopwords, not punctuation, longer than one char
+        self.is_content = (
+            ~self.is_stopword
+            & ~self.is_punctuation
+            & np.array([len(term) > 1 for term in self.terms], dtype=bool)
+        )
+
+    @property
+    def num_sentences(self):
+        return self.counts.shape[0]
+
+    def term_ids(self, terms):
+        """
+        Map terms to their IDs.
+
+        Args:
+            terms (list): Terms to look up (matched case-insensitively)
+
+        Returns:
+            np.ndarray: Term IDs, -1 for terms not in the vocabulary
+        """
+        return np.array([self.vocabulary.get(term.lower(), -1) for term in terms], dtype=np.int64)
+
+    def range_totals(self, start=0, end=None):
+        """
+        Total term counts over a range of sentences.
+
+        Args:
+            start (int): First sentence index
+            end (int): Sentence index to stop before (default: end of text)
+
+        Returns:
+            np.ndarray: Count of each term within the range
+        """
+        if start == 0 and (end is None or end >= self.num_sentences):
+            return self.term_totals
+        return np.asarray(self.counts[start:end].sum(axis=0)).ravel()
+
+    def top_term_ids(self, top_n=10, totals=None):
+        """
+        IDs of the most frequent content terms.
+
+        Args:
+            top_n (int): Number of terms to return
+            totals (np.ndarray): Term counts to rank (default: whole text)
+
+        Returns:
+            np.ndarray: Term IDs ordered by count, ties by first occurrence
+        """
+        if totals is None:
+            totals = self.term_totals
+        candidates = np.flatnonzero(self.is_content & (totals > 0))
+        order = np.argsort(-totals[candidates], kind='stable')
+        return candidates[order[:top_n]]
+
+    def top_terms(self, top_n=10, totals=None):
+        """
+        Most frequent content terms.
+
+        Args:
+            top_n (int): Number of terms to return
+            totals (np.ndarray): Term counts to rank (default: whole text)
+
+        Returns:
+            list: Top terms
+        """
+        return [self.terms[i] for i in self.top_term_ids(top_n, totals)]
+
+    def densities(self, keywords):
+        """
+        Keyword densities as a percentage of non-stopword tokens.
+
+        Args:
+            keywords (list): Keywords to measure
+
+        Returns:
+            dict: Keyword densities
+        """
+        total = int(np.count_nonzero(~self.is_stopword[self.token_ids]))
+        ids = self.term_ids(keywords)
+        known = ids >= 0
+        counts = np.zeros(len(ids))
+        counts[known] = self.term_totals[ids[known]]
+        values = counts / total * 100 if total > 0 else np.zeros(len(ids))
+        return {keyword: float(value) for keyword, value in zip(keywords, values)}
+
+    def sentence_hits(self, term_ids):
+        """
+        Number of distinct given terms present in each sentence.
+
+        Args:
+            term_ids (np.ndarray): Term IDs to look for
+
+        Returns:
+            np.ndarray: Hit count for each sentence
+        """
+        term_ids = term_ids[term_ids >= 0]
+        if len(term_ids) == 0:
+            return np.zeros(self.num_sentences)
+        return np.asarray((self.counts[:, term_ids] > 0).sum(axis=1)).ravel()
+
+    def sentence_lengths(self):
+        """
+        Number of word tokens (punctuation excluded) in each sentence.
+
+        Returns:
+            np.ndarray: Word count for each sentence
+        """
+        is_word = ~self.is_punctuation[self.token_ids]
+        return np.bincount(self.sentence_ids, weights=is_word, minlength=self.num_sentences)
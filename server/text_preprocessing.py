@@ -6,6 +6,8 @@ from nltk.corpus import stopwords
 from nltk.stem import PorterStemmer, WordNetLemmatizer
 from collections import Counter
 import numpy as np
+from batch_processing import process_in_pool
+from term_index import TermIndex
 
 # Download necessary NLTK resources
 try:
@@ -157,6 +159,24 @@ class TextPreprocessor:
         # Finally, remove any extra whitespace created during preprocessing
         return self.remove_whitespace(text)
     
+    def clean_many(self, texts, workers=None, chunksize=16, **clean_kwargs):
+        """
+        Clean many texts in parallel using a process pool.
+        
+        Args:
+            texts (iterable): Input texts (may be a generator)
+            workers (int): Number of worker processes (default: CPU count, 1 = no pool)
+            chunksize (int): Number of texts sent to a worker at a time
+            **clean_kwargs: Options forwarded to clean_text
+            
+        Yields:
+            str: Cleaned text for each input, in input order
+        """
+        return process_in_pool(
+            TextPreprocessor, (self.language,), 'clean_text', texts,
+            method_kwargs=clean_kwargs, workers=workers, chunksize=chunksize
+        )
+    
     def text_to_sentences(self, text, clean=True):
         """
         Split text into cleaned sentences.
@@ -173,6 +193,31 @@ class TextPreprocessor:
             sentences = [self.clean_text(sentence, stem=False, lemmatize=False) for sentence in sentences]
         return sentences
     
+    def build_term_index(self, text):
+        """
+        Tokenize text once into a shared term index.
+        
+        Args:
+            text (str): Input text
+            
+        Returns:
+            TermIndex: Vocabulary, token IDs and sentence-by-term counts
+        """
+        return self.index_sentences(self.tokenize_sentences(text))
+    
+    def index_sentences(self, sentences):
+        """
+        Build a term index over already split sentences.
+        
+        Args:
+            sentences (list): Sentence strings
+            
+        Returns:
+            TermIndex: Vocabulary, token IDs and sentence-by-term counts
+        """
+        tokenized = [self.tokenize_words(self.normalize_case(sentence)) for sentence in sentences]
+        return TermIndex(sentences, tokenized, self.stop_words)
+    
     def calculate_keyword_density(self, text, keywords=None, top_n=10):
         """
         Calculate keyword density in the text.
@@ -185,19 +230,12 @@ class TextPreprocessor:
         Returns:
             dict: Keyword densities (percentage of text)
         """
-        processed_text = self.remove_stopwords(self.normalize_case(text))
-        words = self.tokenize_words(processed_text)
-        total_words = len(words)
+        index = self.build_term_index(text)
         
         if not keywords:
-            keywords = self.extract_keywords(text, top_n)
+            keywords = index.top_terms(top_n)
         
-        densities = {}
-        for keyword in keywords:
-            keyword_count = words.count(keyword.lower())
-            densities[keyword] = (keyword_count / total_words) * 100 if total_words > 0 else 0
-            
-        return densities
+        return index.densities(keywords)
 
     def get_text_statistics(self, text):
         """
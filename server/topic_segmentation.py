@@ -0,0 +1,132 @@
+"""
+Topic Segmentation
+
+TextTiling-style topic segmentation over a TermIndex.
+For every gap between sentences, the term counts of the block of sentences
+before the gap are compared with the block after it. Gaps where lexical
+cohesion dips sharply relative to the surrounding peaks (high depth score)
+are taken as topic boundaries.
+"""
+
+import numpy as np
+from scipy import sparse
+
+
+def _block_operator(num_sentences, window, side):
+    """
+    Sparse operator summing the `window` sentences on one side of each gap.
+
+    Row g - 1 corresponds to the gap between sentences g - 1 and g.
+    """
+    gaps = np.arange(1, num_sentences)
+    rows, cols = [], []
+    for offset in range(window):
+        members = gaps - 1 - offset if side == 'left' else gaps + offset
+        valid = (members >= 0) & (members < num_sentences)
+        rows.append(gaps[valid] - 1)
+        cols.append(members[valid])
+    rows = np.concatenate(rows)
+    cols = np.concatenate(cols)
+    return sparse.csr_matrix(
+        (np.ones(len(rows)), (rows, cols)),
+        shape=(num_sentences - 1, num_sentences)
+    )
+
+
+def gap_similarities(index, window):
+    """
+    Cosine similarity between the blocks on either side of every sentence gap.
+
+    Args:
+        index (TermIndex): Term index of the text
+        window (int): Number of sentences per block
+
+    Returns:
+        np.ndarray: Similarity for each of the num_sentences - 1 gaps
+    """
+    num_sentences = index.num_sentences
+    if num_sentences < 2:
+        return np.zeros(0)
+
+    content_counts = index.counts @ sparse.diags(index.is_content.astype(np.float64))
+    left = _block_operator(num_sentences, window, 'left') @ content_counts
+    right = _block_operator(num_sentences, window, 'right') @ content_counts
+
+    dot = np.asarray(left.multiply(right).sum(axis=1)).ravel()
+    left_norm = np.sqrt(np.asarray(left.multiply(left).sum(axis=1)).ravel())
+    right_norm = np.sqrt(np.asarray(right.multiply(right).sum(axis=1)).ravel())
+    denominator = left_norm * right_norm
+    return np.divide(dot, denominator, out=np.zeros_like(dot), where=denominator > 0)
+
+
+def depth_scores(similarities):
+    """
+    TextTiling depth score of every gap.
+
+    The depth of a gap is how far its similarity lies below the highest
+    point reached by climbing uphill to its left plus the same to its right.
+
+    Args:
+        similarities (np.ndarray): Gap similarities
+
+    Returns:
+        np.ndarray: Depth score for each gap
+    """
+    num_gaps = len(similarities)
+    left_peak = np.empty(num_gaps)
+    right_peak = np.empty(num_gaps)
+    for i in range(num_gaps):
+        if i > 0 and similarities[i - 1] >= similarities[i]:
+            left_peak[i] = left_peak[i - 1]
+        else:
+            left_peak[i] = similarities[i]
+    for i in range(num_gaps - 1, -1, -1):
+        if i < num_gaps - 1 and similarities[i + 1] >= similarities[i]:
+            right_peak[i] = right_peak[i + 1]
+        else:
+            right_peak[i] = similarities[i]
+    return (left_peak - similarities) + (right_peak - similarities)
+
+
+def find_boundaries(index, max_segments=5, window=None):
+    """
+    Find topic boundaries in a text.
+
+    Args:
+        index (TermIndex): Term index of the text
+        max_segments (int): Maximum number of segments
+        window (int): Sentences per comparison block (default: scaled to text length)
+
+    Returns:
+        list: Sorted sentence indices at which a new segment starts (excluding 0)
+    """
+    num_sentences = index.num_sentences
+    if max_segments <= 1 or num_sentences < 2:
+        return []
+    if window is None:
+        window = int(np.clip(num_sentences // (4 * max_segments), 2, 10))
+
+    similarities = gap_similarities(index, window)
+    # Light smoothing so single noisy gaps don't dominate
+    if len(similarities) >= 3:
+        smoothed = np.convolve(similarities, np.ones(3) / 3, mode='same')
+        smoothed[0], smoothed[-1] = similarities[0], similarities[-1]
+        similarities = smoothed
+    depths = depth_scores(similarities)
+
+    # Keep gaps whose depth is notably above average, deepest first
+    cutoff = depths.mean() - depths.std() / 2
+    candidates = np.flatnonzero((depths > cutoff) & (depths > 0))
+    candidates = candidates[np.argsort(-depths[candidates], kind='stable')]
+
+    boundaries = []
+    for gap in candidates:
+        start = gap + 1  # Gap g - 1 separates sentence g - 1 from sentence g
+        if start < window or num_sentences - start < window:
+            continue
+        if any(abs(start - other) < window for other in boundaries):
+            continue
+        boundaries.append(int(start))
+        if len(boundaries) >= max_segments - 1:
+            break
+    return sorted(boundaries)
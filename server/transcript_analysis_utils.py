@@ -7,6 +7,39 @@ for transcript analysis in a video summarization application.
 
 import numpy as np
 from text_preprocessing import TextPreprocessor
+from batch_processing import process_in_pool
+from sentence_graph import textrank_scores
+from topic_segmentation import find_boundaries
+from sentiment_lexicon import SentimentLexicon
+
+def tag_cloud_from_counts(top_words):
+    """
+    Turn (word, count) pairs into tag cloud entries.
+    
+    Args:
+        top_words (list): (word, count) pairs sorted by count, descending
+        
+    Returns:
+        list: List of {text, weight} dictionaries with weights on a 1-10 scale
+    """
+    # Normalize weights to 1-10 range for visualization
+    max_count = top_words[0][1] if top_words else 1
+    min_count = top_words[-1][1] if top_words else 1
+    
+    tag_cloud_data = []
+    for word, count in top_words:
+        # Normalize to 1-10 scale if there's a range, otherwise set to 5
+        if max_count > min_count:
+            weight = 1 + 9 * (count - min_count) / (max_count - min_count)
+        else:
+            weight = 5
+            
+        tag_cloud_data.append({
+            'text': word,
+            'weight': weight
+        })
+        
+    return tag_cloud_data
 
 class TranscriptAnalyzer:
     """
@@ -21,131 +54,133 @@ class TranscriptAnalyzer:
         Args:
             language (str): Language of the transcript
         """
+        self.language = language
         self.preprocessor = TextPreprocessor(language=language)
+        self.sentiment_lexicon = SentimentLexicon()
     
-    def extract_key_sentences(self, transcript, num_sentences=5):
+    def extract_key_sentences(self, transcript, num_sentences=5, index=None, method='keywords'):
         """
-        Extract key sentences from transcript based on keyword density.
+        Extract key sentences from transcript.
         
         Args:
             transcript (str): Video transcript text
             num_sentences (int): Number of key sentences to extract
+            index (TermIndex): Optional prebuilt term index of the transcript
+            method (str): 'keywords' to rank by keyword density, 'textrank' to rank
+                by centrality in the sentence-similarity graph
             
         Returns:
             list: Extracted key sentences
         """
-        # Clean the transcript while preserving sentence structure
-        sentences = self.preprocessor.tokenize_sentences(transcript)
-        cleaned_sentences = [self.preprocessor.clean_text(
-            sent, 
-            punctuation=False, 
-            stopwords=False, 
-            lemmatize=False
-        ) for sent in sentences]
-        
-        # Extract keywords from the entire transcript
-        keywords = self.preprocessor.extract_keywords(transcript, top_n=20)
-        
-        # Score sentences based on keyword presence
-        sentence_scores = []
-        for i, sentence in enumerate(cleaned_sentences):
-            if len(sentence.split()) < 3:  # Skip very short sentences
-                sentence_scores.append(0)
-                continue
-                
-            score = 0
-            for keyword in keywords:
-                if keyword.lower() in sentence.lower():
-                    score += 1
-            
-            # Normalize by sentence length to avoid bias towards longer sentences
-            score = score / len(sentence.split()) if len(sentence.split()) > 0 else 0
-            sentence_scores.append(score)
+        if index is None:
+            index = self.preprocessor.build_term_index(transcript)
+        sentence_scores = self.score_sentences(index, method=method)
         
         # Get top N sentences (with original formatting)
         top_indices = np.argsort(sentence_scores)[-num_sentences:]
         top_indices = sorted(top_indices)  # Sort by position in text, not by score
         
-        return [sentences[i] for i in top_indices]
+        return [index.sentences[i] for i in top_indices]
+    
+    def score_sentences(self, index, method='keywords'):
+        """
+        Score every sentence of a transcript.
+        
+        Args:
+            index (TermIndex): Term index of the transcript
+            method (str): 'keywords' or 'textrank'
+            
+        Returns:
+            np.ndarray: Score for each sentence (very short sentences score 0)
+        """
+        if method == 'keywords':
+            return self._keyword_sentence_scores(index)
+        if method == 'textrank':
+            scores = textrank_scores(index)
+            scores[index.sentence_lengths() < 3] = 0  # Skip very short sentences
+            return scores
+        raise ValueError(f"Unknown sentence scoring method: {method}")
+    
+    def _keyword_sentence_scores(self, index, top_n=20):
+        """
+        Score sentences by how many of the transcript's top keywords they contain.
+        
+        Args:
+            index (TermIndex): Term index of the transcript
+            top_n (int): Number of transcript keywords to score against
+            
+        Returns:
+            np.ndarray: Score for each sentence
+        """
+        keyword_ids = index.top_term_ids(top_n)
+        hits = index.sentence_hits(keyword_ids)
+        lengths = index.sentence_lengths()
+        
+        # Normalize by sentence length to avoid bias towards longer sentences,
+        # skipping very short sentences entirely
+        scores = np.zeros(index.num_sentences)
+        scored = lengths >= 3
+        scores[scored] = hits[scored] / lengths[scored]
+        return scores
     
-    def identify_topic_segments(self, transcript, max_segments=5):
+    def identify_topic_segments(self, transcript, max_segments=5, index=None):
         """
         Identify topic segments in the transcript.
         
+        Segment boundaries are placed where lexical cohesion between
+        neighbouring blocks of sentences drops (TextTiling).
+        
         Args:
             transcript (str): Video transcript text
             max_segments (int): Maximum number of segments to identify
+            index (TermIndex): Optional prebuilt term index of the transcript
             
         Returns:
             list: List of segment dictionaries with start, end, and keywords
         """
-        # Clean and split into sentences
-        sentences = self.preprocessor.tokenize_sentences(transcript)
+        if index is None:
+            index = self.preprocessor.build_term_index(transcript)
+        sentences = index.sentences
+        if not sentences:
+            return []
         
-        # Simple approach: split into roughly equal segments
-        segment_size = max(1, len(sentences) // max_segments)
-        segments = []
+        boundaries = find_boundaries(index, max_segments=max_segments)
+        starts = [0] + boundaries
+        ends = boundaries + [len(sentences)]
         
-        for i in range(0, len(sentences), segment_size):
-            segment_text = ' '.join(sentences[i:i+segment_size])
-            
-            # Get keywords for this segment
-            segment_keywords = self.preprocessor.extract_keywords(segment_text, top_n=5)
-            
+        segments = []
+        for start, end in zip(starts, ends):
+            # Get keywords for this segment from its rows of the term index
+            segment_totals = index.range_totals(start, end)
             segments.append({
-                'start_idx': i,
-                'end_idx': min(i+segment_size-1, len(sentences)-1),
-                'start': sentences[i],
-                'end': sentences[min(i+segment_size-1, len(sentences)-1)],
-                'keywords': segment_keywords
+                'start_idx': start,
+                'end_idx': end - 1,
+                'start': sentences[start],
+                'end': sentences[end - 1],
+                'keywords': index.top_terms(5, totals=segment_totals)
             })
             
-            if len(segments) >= max_segments:
-                break
-                
         return segments
     
-    def analyze_sentiment_keywords(self, transcript):
+    def analyze_sentiment_keywords(self, transcript, index=None, timeline_points=20):
         """
-        Analyze sentiment-related keywords in the transcript.
-        This is a simplified demonstration - a real implementation would use proper sentiment analysis.
+        Analyze sentiment in the transcript with a weighted lexicon.
+        
+        Words are scored from the lexicon with negation ("not good") and
+        intensifiers ("very good") applied, summed per sentence, and the
+        sentence scores are smoothed into a timeline across the video.
         
         Args:
             transcript (str): Video transcript text
+            index (TermIndex): Optional prebuilt term index of the transcript
+            timeline_points (int): Maximum number of sentiment timeline points
             
         Returns:
-            dict: Sentiment-related keyword counts
+            dict: Sentiment word counts, overall score and timeline
         """
-        # Very simplified approach - just counting positive and negative terms
-        # In a real implementation, use a proper sentiment analysis library
-        
-        positive_terms = ['good', 'great', 'excellent', 'beneficial', 'positive', 
-                         'advantage', 'helpful', 'improve', 'better', 'best', 
-                         'success', 'successful', 'effective', 'efficient', 'recommended']
-        
-        negative_terms = ['bad', 'poor', 'terrible', 'negative', 'disadvantage', 
-                         'harmful', 'worse', 'worst', 'fail', 'failure', 
-                         'ineffective', 'inefficient', 'problem', 'difficult', 'challenging']
-        
-        # Clean and tokenize
-        cleaned_text = self.preprocessor.clean_text(
-            transcript, 
-            punctuation=True,
-            stopwords=False,
-            lemmatize=True
-        )
-        words = self.preprocessor.tokenize_words(cleaned_text.lower())
-        
-        # Count occurrences
-        positive_count = sum(1 for word in words if word in positive_terms)
-        negative_count = sum(1 for word in words if word in negative_terms)
-        
-        return {
-            'positive_keywords': positive_count,
-            'negative_keywords': negative_count,
-            'sentiment_ratio': positive_count / max(1, negative_count),
-            'total_analyzed_keywords': positive_count + negative_count
-        }
+        if index is None:
+            index = self.preprocessor.build_term_index(transcript)
+        return self.sentiment_lexicon.analyze(index, timeline_points=timeline_points)
     
     def generate_tag_cloud_data(self, transcript, max_tags=30):
         """
@@ -179,24 +214,7 @@ class TranscriptAnalyzer:
         # Get top N words
         top_words = sorted_words[:max_tags]
         
-        # Normalize weights to 1-10 range for visualization
-        max_count = top_words[0][1] if top_words else 1
-        min_count = top_words[-1][1] if top_words else 1
-        
-        tag_cloud_data = []
-        for word, count in top_words:
-            # Normalize to 1-10 scale if there's a range, otherwise set to 5
-            if max_count > min_count:
-                weight = 1 + 9 * (count - min_count) / (max_count - min_count)
-            else:
-                weight = 5
-                
-            tag_cloud_data.append({
-                'text': word,
-                'weight': weight
-            })
-            
-        return tag_cloud_data
+        return tag_cloud_from_counts(top_words)
     
     def extract_structured_insights(self, transcript):
         """
@@ -211,17 +229,20 @@ class TranscriptAnalyzer:
         # Get text statistics
         stats = self.preprocessor.get_text_statistics(transcript)
         
+        # Tokenize once and share the term index between the analyses below
+        index = self.preprocessor.build_term_index(transcript)
+        
         # Extract key sentences
-        key_sentences = self.extract_key_sentences(transcript, num_sentences=5)
+        key_sentences = self.extract_key_sentences(transcript, num_sentences=5, index=index)
         
         # Get keywords
-        keywords = self.preprocessor.extract_keywords(transcript, top_n=10)
+        keywords = index.top_terms(10)
         
         # Get topic segments
-        segments = self.identify_topic_segments(transcript, max_segments=3)
+        segments = self.identify_topic_segments(transcript, max_segments=3, index=index)
         
         # Sentiment analysis
-        sentiment = self.analyze_sentiment_keywords(transcript)
+        sentiment = self.analyze_sentiment_keywords(transcript, index=index)
         
         # Tag cloud data
         tag_cloud = self.generate_tag_cloud_data(transcript, max_tags=20)
@@ -234,6 +255,23 @@ class TranscriptAnalyzer:
             'sentiment': sentiment,
             'tag_cloud': tag_cloud[:10]  # Return just 10 for brevity
         }
+    
+    def analyze_many(self, transcripts, workers=None, chunksize=4):
+        """
+        Extract structured insights from many transcripts using a process pool.
+        
+        Args:
+            transcripts (iterable): Transcript texts (may be a generator)
+            workers (int): Number of worker processes (default: CPU count, 1 = no pool)
+            chunksize (int): Number of transcripts sent to a worker at a time
+            
+        Yields:
+            dict: Structured insights for each transcript, in input order
+        """
+        return process_in_pool(
+            TranscriptAnalyzer, (self.language,), 'extract_structured_insights', transcripts,
+            workers=workers, chunksize=chunksize
+        )
 
 # Example usage
 if __name__ == "__main__":
@@ -0,0 +1,180 @@
+"""
+Transcript Index
+
+Persistent store of timestamped transcript segments with a SQLite FTS5
+full-text index over every processed video, so a search can return the
+matching moments of one video or of the whole library.
+"""
+
+import re
+import sqlite3
+import time
+from contextlib import closing
+from urllib.parse import urlparse, parse_qs
+
+YOUTUBE_ID_PATTERN = re.compile(r'^[A-Za-z0-9_-]{11}$')
+QUERY_TERM_PATTERN = re.compile(r'\w+', re.UNICODE)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS videos (
+    video_id TEXT PRIMARY KEY,
+    url TEXT,
+    indexed_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS segments (
+    id INTEGER PRIMARY KEY,
+    video_id TEXT NOT NULL REFERENCES videos(video_id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    start REAL NOT NULL,
+    end REAL NOT NULL,
+    text TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_segments_video ON segments(video_id, position);
+CREATE VIRTUAL TABLE IF NOT EXISTS segments_fts USING fts5(
+    text, content='segments', content_rowid='id', tokenize='porter unicode61'
+);
+CREATE TRIGGER IF NOT EXISTS segments_ai AFTER INSERT ON segments BEGIN
+    INSERT INTO segments_fts(rowid, text) VALUES (new.id, new.text);
+END;
+CREATE TRIGGER IF NOT EXISTS segments_ad AFTER DELETE ON segments BEGIN
+    INSERT INTO segments_fts(segments_fts, rowid, text) VALUES ('delete', old.id, old.text);
+END;
+"""
+
+
+def extract_video_id(url):
+    """
+    Get a stable video ID from a YouTube URL.
+
+    Args:
+        url (str): Video URL (watch, youtu.be, shorts or embed form)
+
+    Returns:
+        str: The 11-character YouTube ID, or the URL itself if none is found
+    """
+    parsed = urlparse(url.strip())
+    host = (parsed.hostname or '').lower()
+    candidates = []
+    if host.endswith('youtu.be'):
+        candidates.append(parsed.path.lstrip('/').split('/')[0])
+    if 'youtube' in host:
+        candidates += parse_qs(parsed.query).get('v', [])
+        parts = parsed.path.strip('/').split('/')
+        if len(parts) >= 2 and parts[0] in ('shorts', 'embed', 'live', 'v'):
+            candidates.append(parts[1])
+    for candidate in candidates:
+        if YOUTUBE_ID_PATTERN.match(candidate):
+            return candidate
+    return url.strip()
+
+
+def build_match_query(query):
+    """
+    Turn free text into a safe FTS5 query matching all of its words.
+
+    Each word is quoted, so FTS5 operators and punctuation in user input
+    can't cause syntax errors.
+    """
+    return ' '.join(f'"{term}"' for term in QUERY_TERM_PATTERN.findall(query))
+
+
+class TranscriptIndex:
+    """
+    SQLite-backed store and full-text index of timestamped transcript segments.
+    """
+
+    def __init__(self, path='transcripts.db'):
+        """
+        Open (and create if needed) the index database.
+
+        Args:
+            path (str): SQLite database file
+        """
+        self.path = path
+        with closing(self._connect()) as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.executescript(SCHEMA)
+
+    def _connect(self):
+        # A connection per operation keeps the index safe to use from request threads
+        conn = sqlite3.connect(self.path, timeout=10)
+        conn.row_factory = sqlite3.Row
+        conn.execute('PRAGMA foreign_keys=ON')
+        return conn
+
+    def save_transcript(self, video_id, segments, url=None):
+        """
+        Store a video's segments, replacing any previously stored ones.
+
+        Args:
+            video_id (str): Video ID
+            segments (list): Whisper segments with start, end and text
+            url (str): Source URL of the video
+        """
+        rows = [
+            (video_id, position, float(segment['start']), float(segment['end']), segment['text'].strip())
+            for position, segment in enumerate(segments)
+            if segment.get('text', '').strip()
+        ]
+        with closing(self._connect()) as conn, conn:
+            conn.execute('DELETE FROM segments WHERE video_id = ?', (video_id,))
+            conn.execute(
+                'INSERT INTO videos(video_id, url, indexed_at) VALUES (?, ?, ?) '
+                'ON CONFLICT(video_id) DO UPDATE SET url = excluded.url, indexed_at = excluded.indexed_at',
+                (video_id, url, time.time())
+            )
+            conn.executemany(
+                'INSERT INTO segments(video_id, position, start, end, text) VALUES (?, ?, ?, ?, ?)',
+                rows
+            )
+
+    def get_segments(self, video_id):
+        """
+        All stored segments of a video, in order.
+
+        Args:
+            video_id (str): Video ID
+
+        Returns:
+            list: {start, end, text} dictionaries (empty if the video isn't indexed)
+        """
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                'SELECT start, end, text FROM segments WHERE video_id = ? ORDER BY position',
+                (video_id,)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def search(self, query, video_id=None, limit=20):
+        """
+        Find the transcript moments matching a query.
+
+        Args:
+            query (str): Words to search for (all must match)
+            video_id (str): Restrict the search to one video (optional)
+            limit (int): Maximum number of results
+
+        Returns:
+            list: {video_id, start, end, text, snippet} dictionaries, best match first
+        """
+        match = build_match_query(query)
+        if not match:
+            return []
+
+        sql = """
+            SELECT s.video_id, s.start, s.end, s.text,
+                   snippet(segments_fts, 0, '[', ']', '...', 16) AS snippet
+            FROM segments_fts
+            JOIN segments s ON s.id = segments_fts.rowid
+            WHERE segments_fts MATCH ?
+        """
+        params = [match]
+        if video_id:
+            sql += ' AND s.video_id = ?'
+            params.append(video_id)
+        sql += ' ORDER BY bm25(segments_fts) LIMIT ?'
+        params.append(limit)
+
+        with closing(self._connect()) as conn:
+            rows = conn.execute(sql, params).fetchall()
+        return [dict(row) for row in rows]